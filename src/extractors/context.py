@@ -0,0 +1,203 @@
+import json
+import re
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from bs4 import BeautifulSoup, Tag
+
+from .utils_format import dig, index_data_at
+
+try:
+    import orjson
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers keep
+    # catching the stdlib exception either way. orjson only accepts exact str
+    # instances, so NavigableStrings have to be converted first.
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Raw markup, as fetched (bytes) or already decoded (str).
+Markup = Union[str, bytes]
+
+def _compile_for_markup(pattern: str) -> Dict[type, "re.Pattern[Any]"]:
+    # One compiled pattern per markup type; re will not mix str and bytes.
+    flags = re.IGNORECASE | re.DOTALL
+    return {str: re.compile(pattern, flags), bytes: re.compile(pattern.encode("ascii"), flags)}
+
+def _markup_type(markup: Markup) -> type:
+    return bytes if isinstance(markup, bytes) else str
+
+# Every <script> element, as (attributes, body); the two attribute patterns
+# below then tell a JSON-LD block and the __NEXT_DATA__ state apart. The
+# lookbehind keeps them off suffixed names such as data-type or data-id.
+_SCRIPT_RES = _compile_for_markup(r"<script\b([^>]*)>(.*?)</script\s*>")
+_LD_JSON_TYPE_RES = _compile_for_markup(r"(?<![\w-])type\s*=\s*[\"']?application/ld\+json(?=[\"'\s]|$)")
+_NEXT_DATA_ID_RES = _compile_for_markup(r"(?<![\w-])id\s*=\s*[\"']?__NEXT_DATA__(?=[\"'\s]|$)")
+
+def _loads_block(raw: Markup) -> Any:
+    # Both parsers decode UTF-8 bytes themselves, which skips building a str.
+    # Bytes that are not valid UTF-8 raise UnicodeDecodeError from json (a
+    # ValueError, like JSONDecodeError), so callers catch ValueError.
+    return _json_loads(raw if isinstance(raw, bytes) else str(raw))
+
+def _iter_ld_json_blocks(soup: BeautifulSoup) -> Iterator[Any]:
+    for script in soup.find_all("script", type="application/ld+json"):
+        if not script.string:
+            continue
+        try:
+            yield _json_loads(str(script.string))
+        except json.JSONDecodeError:
+            continue
+
+def _extract_ld_json_blocks(soup: BeautifulSoup) -> List[Any]:
+    return list(_iter_ld_json_blocks(soup))
+
+def _iter_product_ld(soup: BeautifulSoup) -> Iterator[Dict[str, Any]]:
+    """
+    Yield JSON-LD objects whose @type is Product.
+
+    A raw substring test skips BreadcrumbList/Organization/WebPage blocks
+    before they are decoded, and decoding is lazy, so a consumer that stops
+    at the first hit never touches the remaining scripts.
+    """
+    return _iter_product_ld_blocks(
+        script.string for script in soup.find_all("script", type="application/ld+json")
+    )
+
+def _iter_product_ld_blocks(blocks: Iterable[Optional[Markup]]) -> Iterator[Dict[str, Any]]:
+    for raw in blocks:
+        if not raw or (b'"Product"' if isinstance(raw, bytes) else '"Product"') not in raw:
+            continue
+        try:
+            data = _loads_block(raw)
+        except ValueError:
+            continue
+        for item in data if isinstance(data, list) else (data,):
+            if isinstance(item, dict) and item.get("@type") == "Product":
+                yield item
+
+def _find_product_ld(soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
+    return next(_iter_product_ld(soup), None)
+
+def _scan_scripts(html: Markup) -> Tuple[Optional[Dict[str, Any]], Optional[Markup]]:
+    """
+    One pass over the raw markup's <script> elements yielding both the
+    Product JSON-LD object and the undecoded __NEXT_DATA__ body. The scan
+    stops as soon as both have turned up.
+    """
+    kind = _markup_type(html)
+    is_ld_json = _LD_JSON_TYPE_RES[kind].search
+    is_next_data = _NEXT_DATA_ID_RES[kind].search
+    product_ld: Optional[Dict[str, Any]] = None
+    next_data_raw: Optional[Markup] = None
+    for match in _SCRIPT_RES[kind].finditer(html):
+        attrs, body = match.group(1), match.group(2)
+        if product_ld is None and is_ld_json(attrs):
+            product_ld = next(_iter_product_ld_blocks((body,)), None)
+        elif next_data_raw is None and is_next_data(attrs):
+            next_data_raw = body
+        if product_ld is not None and next_data_raw is not None:
+            break
+    return product_ld, next_data_raw
+
+def _decode_next_data(raw: Optional[Markup]) -> Optional[Dict[str, Any]]:
+    if not raw or not raw.strip():
+        return None
+    try:
+        data = _loads_block(raw)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+def extract_product_details(next_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    The product state object of a Sephora page's __NEXT_DATA__
+    (props.pageProps.productDetails), or None when the payload does not
+    have that shape.
+    """
+    node = dig(next_data, "props", "pageProps", "productDetails")
+    return node if isinstance(node, dict) else None
+
+@dataclass
+class ParsedPage:
+    """
+    A product page parsed once and shared by every extractor.
+
+    Holds the soup together with the JSON-LD Product block, the page's
+    __NEXT_DATA__ state and an index of every [data-at] node, so the
+    extractors never re-walk the <script> tags or rescan the page per lookup.
+    """
+
+    soup: BeautifulSoup
+    product_ld: Optional[Dict[str, Any]] = None
+    data_at_index: Dict[str, List[Tag]] = field(default_factory=dict)
+    next_data: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_soup(cls, soup: BeautifulSoup) -> "ParsedPage":
+        script = soup.find("script", id="__NEXT_DATA__")
+        return cls(
+            soup=soup,
+            product_ld=_find_product_ld(soup),
+            data_at_index=index_data_at(soup),
+            next_data=_decode_next_data(script.string if script else None),
+        )
+
+    @classmethod
+    def from_html(cls, html: Markup, soup: BeautifulSoup) -> "ParsedPage":
+        """
+        Like from_soup(), but the Product block and __NEXT_DATA__ are read
+        from html (the markup soup was built from) in a single regex pass
+        instead of a walk of the <script> tags, so soup may be strained
+        without keeping them.
+        """
+        product_ld, next_data_raw = _scan_scripts(html)
+        return cls(
+            soup=soup,
+            product_ld=product_ld,
+            data_at_index=index_data_at(soup),
+            next_data=_decode_next_data(next_data_raw),
+        )
+
+    @cached_property
+    def ld_blocks(self) -> List[Any]:
+        """
+        Every decoded JSON-LD block, for callers that need more than the
+        Product block. Decoded on first access only.
+        """
+        return _extract_ld_json_blocks(self.soup)
+
+    @cached_property
+    def product_details(self) -> Optional[Dict[str, Any]]:
+        """
+        The productDetails object of next_data; see extract_product_details.
+        """
+        return extract_product_details(self.next_data)
+
+    def find_data_at(self, key: str) -> Optional[Tag]:
+        """
+        Indexed equivalent of soup.find(attrs={"data-at": key}).
+        """
+        return self.data_at_index.get(key, [None])[0]
+
+_PAGE_CACHE_ATTR = "_parsed_page"
+
+def as_parsed_page(page: Union[ParsedPage, BeautifulSoup]) -> ParsedPage:
+    """
+    Accept either a ParsedPage or a bare soup (older call sites) and return
+    a ParsedPage.
+
+    The page built for a bare soup is cached on the soup itself, so calling
+    several parsers with the same soup decodes its JSON-LD only once.
+    """
+    if isinstance(page, ParsedPage):
+        return page
+    # Go through __dict__: attribute access on a Tag falls back to a
+    # descendant search (soup.foo == soup.find("foo")) when the name is unset.
+    cached = page.__dict__.get(_PAGE_CACHE_ATTR)
+    if cached is None:
+        cached = ParsedPage.from_soup(page)
+        page.__dict__[_PAGE_CACHE_ATTR] = cached
+    return cached
@@ -1,15 +1,17 @@
-import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
+from .context import ParsedPage, as_parsed_page
 from .utils_format import (
     clean_text,
+    dig,
     infer_product_id_from_url,
     parse_float,
     parse_int,
     parse_number_with_suffix,
+    sselect,
 )
 
 logger = logging.getLogger(__name__)
@@ -20,37 +22,23 @@ def _safe_meta_content(soup: BeautifulSoup, **attrs: str) -> Optional[str]:
         return tag["content"]
     return None
 
-def _extract_ld_json_blocks(soup: BeautifulSoup) -> List[Any]:
-    blocks: List[Any] = []
-    for script in soup.find_all("script", type="application/ld+json"):
-        try:
-            if not script.string:
-                continue
-            data = json.loads(script.string)
-            blocks.append(data)
-        except json.JSONDecodeError:
-            continue
-    return blocks
-
-def _find_product_ld(blocks: List[Any]) -> Optional[Dict[str, Any]]:
-    for block in blocks:
-        if isinstance(block, dict) and block.get("@type") == "Product":
-            return block
-        if isinstance(block, list):
-            for item in block:
-                if isinstance(item, dict) and item.get("@type") == "Product":
-                    return item
-    return None
+def _details_str(details: Dict[str, Any], *keys: str) -> str:
+    value = dig(details, *keys)
+    return value if isinstance(value, str) else ""
 
-def parse_product_info(soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+def parse_product_info(page: Union[ParsedPage, BeautifulSoup], url: str) -> Dict[str, Any]:
     """
     Extract core product information from a Sephora product page.
 
     Uses OpenGraph tags, JSON-LD, and common Sephora markup as fallbacks.
+    JSON-LD wins over the __NEXT_DATA__ productDetails state, which wins
+    over meta tags and markup; each field falls through independently.
     """
     logger.debug("Parsing product info from %s", url)
-    ld_blocks = _extract_ld_json_blocks(soup)
-    product_ld = _find_product_ld(ld_blocks)
+    page = as_parsed_page(page)
+    soup = page.soup
+    product_ld = page.product_ld
+    details = page.product_details or {}
 
     name = _safe_meta_content(soup, property="og:title") or ""
     description = _safe_meta_content(soup, property="og:description") or ""
@@ -58,48 +46,63 @@ def parse_product_info(soup: BeautifulSoup, url: str) -> Dict[str, Any]:
     brand = ""
     price_text = ""
 
+    if details:
+        name = _details_str(details, "displayName") or name
+        brand = _details_str(details, "brand", "displayName")
+        price_text = _details_str(details, "currentSku", "listPrice")
+
     if product_ld:
         name = product_ld.get("name") or name
         description = product_ld.get("description") or description
         image = product_ld.get("image") or image
         brand_data = product_ld.get("brand")
         if isinstance(brand_data, dict):
-            brand = brand_data.get("name") or ""
+            brand = brand_data.get("name") or brand
         elif isinstance(brand_data, str):
-            brand = brand_data
+            brand = brand_data or brand
         offers = product_ld.get("offers")
         if isinstance(offers, dict):
-            price_text = offers.get("price") or offers.get("priceSpecification", {}).get("price", "")
+            price_text = (
+                offers.get("price") or offers.get("priceSpecification", {}).get("price", "") or price_text
+            )
         elif isinstance(offers, list) and offers:
             offer0 = offers[0]
             if isinstance(offer0, dict):
-                price_text = offer0.get("price", "")
+                price_text = offer0.get("price", "") or price_text
 
     if not brand:
-        brand_tag = soup.find(attrs={"data-at": "brand_name"})
+        brand_tag = page.find_data_at("brand_name")
         if isinstance(brand_tag, Tag):
             brand = clean_text(brand_tag.get_text(strip=True))
 
     if not price_text:
-        price_tag = soup.find(attrs={"data-at": "price"})
+        price_tag = page.find_data_at("price")
         if isinstance(price_tag, Tag):
             price_text = clean_text(price_tag.get_text(strip=True))
 
     love_count = 0
-    love_tag = soup.find(attrs={"data-at": "loves"})
-    if isinstance(love_tag, Tag):
-        love_count = parse_number_with_suffix(love_tag.get_text(strip=True))
+    loves = details.get("lovesCount")
+    if isinstance(loves, int) and not isinstance(loves, bool):
+        love_count = loves
+    else:
+        love_tag = page.find_data_at("loves")
+        if isinstance(love_tag, Tag):
+            love_count = parse_number_with_suffix(love_tag.get_text(strip=True))
 
     availability = True
-    availability_tag = soup.find(attrs={"data-at": "out_of_stock"})
-    if isinstance(availability_tag, Tag):
-        availability = False
+    out_of_stock = dig(details, "currentSku", "isOutOfStock")
+    if isinstance(out_of_stock, bool):
+        availability = not out_of_stock
+    else:
+        availability_tag = page.find_data_at("out_of_stock")
+        if isinstance(availability_tag, Tag):
+            availability = False
 
     product_id = None
     if product_ld:
         product_id = product_ld.get("sku") or product_ld.get("productID")
     if not product_id:
-        product_id = infer_product_id_from_url(url)
+        product_id = _details_str(details, "productId") or infer_product_id_from_url(url)
 
     info = {
         "id": product_id or "",
@@ -114,17 +117,18 @@ def parse_product_info(soup: BeautifulSoup, url: str) -> Dict[str, Any]:
     }
     return info
 
-def parse_product_variants(soup: BeautifulSoup) -> List[Dict[str, Any]]:
+def parse_product_variants(page: Union[ParsedPage, BeautifulSoup]) -> List[Dict[str, Any]]:
     """
     Extract product variants when available.
 
     Attempts to read variants from JSON-LD first; falls back to variant tiles.
     """
     logger.debug("Parsing product variants")
+    page = as_parsed_page(page)
+    soup = page.soup
     variants: List[Dict[str, Any]] = []
 
-    ld_blocks = _extract_ld_json_blocks(soup)
-    product_ld = _find_product_ld(ld_blocks)
+    product_ld = page.product_ld
     if product_ld:
         variants_ld = product_ld.get("isVariantOf") or product_ld.get("offers")
         if isinstance(variants_ld, list):
@@ -152,7 +156,7 @@ def parse_product_variants(soup: BeautifulSoup) -> List[Dict[str, Any]]:
         return variants
 
     # Fallback: best-effort tile parsing
-    tile_candidates = soup.select('[data-comp*="ProductVariant"]:not(script)')
+    tile_candidates = sselect(soup, '[data-comp*="ProductVariant"]:not(script)')
     for idx, tile in enumerate(tile_candidates):
         name_tag = tile.find(attrs={"data-at": "sku_name"}) or tile.find("span")
         img_tag = tile.find("img")
@@ -171,28 +175,32 @@ def parse_product_variants(soup: BeautifulSoup) -> List[Dict[str, Any]]:
 
     return variants
 
-def parse_statistics(soup: BeautifulSoup, reviews: List[Dict[str, Any]]) -> Dict[str, Any]:
+def parse_statistics(
+    page: Union[ParsedPage, BeautifulSoup], reviews: List[Dict[str, Any]]
+) -> Dict[str, Any]:
     """
     Compute statistics from the page and review list.
     Falls back to aggregating from reviews when explicit stats are not present.
     """
     logger.debug("Parsing statistics")
+    page = as_parsed_page(page)
+    soup = page.soup
     average_rating = 0.0
     review_count = 0
     helpful_vote_count = 0
     not_helpful_vote_count = 0
 
-    rating_tag = soup.find(attrs={"data-at": "overall_rating"})
+    rating_tag = page.find_data_at("overall_rating")
     if rating_tag:
         average_rating = parse_float(rating_tag.get_text(strip=True), default=0.0)
 
-    count_tag = soup.find(attrs={"data-at": "total_reviews"})
+    count_tag = page.find_data_at("total_reviews")
     if count_tag:
         review_count = parse_int(count_tag.get_text(strip=True), default=0)
 
     if not reviews:
         # Try to build stats from rating histogram if present
-        histogram_rows = soup.select('[data-comp*="Histogram"] [role="row"]')
+        histogram_rows = sselect(soup, '[data-comp*="Histogram"] [role="row"]')
         if histogram_rows:
             total_reviews = 0
             weighted_sum = 0.0
@@ -213,11 +221,13 @@ def parse_statistics(soup: BeautifulSoup, reviews: List[Dict[str, Any]]) -> Dict
     else:
         # Aggregate from scraped reviews
         total_reviews = len(reviews)
-        total_rating = 0.0
-        for r in reviews:
-            total_rating += float(r.get("rating") or 0)
-            helpful_vote_count += parse_int(r.get("helpful_vote_count"), default=0)
-            not_helpful_vote_count += parse_int(r.get("not_helpful_vote_count"), default=0)
+        total_rating = sum(float(r.get("rating") or 0) for r in reviews)
+        helpful_vote_count = sum(
+            parse_int(r.get("helpful_vote_count"), default=0) for r in reviews
+        )
+        not_helpful_vote_count = sum(
+            parse_int(r.get("not_helpful_vote_count"), default=0) for r in reviews
+        )
         if total_reviews > 0:
             average_rating = total_rating / total_reviews
             review_count = total_reviews
@@ -3,6 +3,13 @@ from typing import Any, Dict, List, Optional
 
 from bs4 import BeautifulSoup
 
+from ..utils.html_utils import DomSource, lexbor_text, resolve_dom_source
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
 logger = logging.getLogger(__name__)
 
 def _parse_questions_from_json(product_json: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -45,56 +52,96 @@ def _parse_questions_from_json(product_json: Dict[str, Any]) -> List[Dict[str, A
 def _parse_questions_from_dom(soup: BeautifulSoup) -> List[Dict[str, Any]]:
     questions: List[Dict[str, Any]] = []
 
-    qa_sections = soup.find_all(
-        lambda tag: tag.name in ("section", "div")
-        and "question" in tag.get_text(" ", strip=True).lower()
-        and tag.find(attrs={"data-at": "qa_question"})
-    )
+    # Each question's parent element already scopes its date and answers, so
+    # a single lookup of the question nodes replaces the old scan of every
+    # section/div (and its full text) on the page.
+    for q_el in soup.find_all(attrs={"data-at": "qa_question"}):
+        question_text = q_el.get_text(" ", strip=True)
+        question_container = q_el.parent
+
+        asked_at_el = question_container.find(attrs={"data-at": "qa_question_date"})
+        asked_at = asked_at_el.get_text(strip=True) if asked_at_el else None
+
+        answers: List[Dict[str, Any]] = []
+        for a_el in question_container.find_all(attrs={"data-at": "qa_answer"}):
+            answer_text = a_el.get_text(" ", strip=True)
+            answer_date_el = a_el.find(attrs={"data-at": "qa_answer_date"})
+            answer_date = (
+                answer_date_el.get_text(strip=True) if answer_date_el else None
+            )
+            author_el = a_el.find(attrs={"data-at": "qa_answer_author"})
+            author = author_el.get_text(strip=True) if author_el else None
 
-    for section in qa_sections:
-        for q_el in section.find_all(attrs={"data-at": "qa_question"}):
-            question_text = q_el.get_text(" ", strip=True)
-            question_container = q_el.parent
+            answers.append(
+                {
+                    "answer": answer_text,
+                    "answered_at": answer_date,
+                    "author": author,
+                }
+            )
 
-            asked_at_el = question_container.find(attrs={"data-at": "qa_question_date"})
-            asked_at = asked_at_el.get_text(strip=True) if asked_at_el else None
+        questions.append(
+            {
+                "product_id": None,
+                "question": question_text,
+                "asked_at": asked_at,
+                "answers": answers,
+            }
+        )
 
-            answers: List[Dict[str, Any]] = []
-            for a_el in question_container.find_all(attrs={"data-at": "qa_answer"}):
-                answer_text = a_el.get_text(" ", strip=True)
-                answer_date_el = a_el.find(attrs={"data-at": "qa_answer_date"})
-                answer_date = (
-                    answer_date_el.get_text(strip=True) if answer_date_el else None
-                )
-                author_el = a_el.find(attrs={"data-at": "qa_answer_author"})
-                author = author_el.get_text(strip=True) if author_el else None
-
-                answers.append(
-                    {
-                        "answer": answer_text,
-                        "answered_at": answer_date,
-                        "author": author,
-                    }
-                )
+    return questions
 
-            questions.append(
+def _lexbor_questions(html: str) -> List[Dict[str, Any]]:
+    questions: List[Dict[str, Any]] = []
+    tree = LexborHTMLParser(html)
+
+    for q_el in tree.css('[data-at="qa_question"]'):
+        question_text = lexbor_text(q_el, " ")
+        question_container = q_el.parent
+
+        asked_at_el = question_container.css_first('[data-at="qa_question_date"]')
+        asked_at = lexbor_text(asked_at_el) if asked_at_el else None
+
+        answers: List[Dict[str, Any]] = []
+        for a_el in question_container.css('[data-at="qa_answer"]'):
+            answer_date_el = a_el.css_first('[data-at="qa_answer_date"]')
+            author_el = a_el.css_first('[data-at="qa_answer_author"]')
+            answers.append(
                 {
-                    "product_id": None,
-                    "question": question_text,
-                    "asked_at": asked_at,
-                    "answers": answers,
+                    "answer": lexbor_text(a_el, " "),
+                    "answered_at": lexbor_text(answer_date_el) if answer_date_el else None,
+                    "author": lexbor_text(author_el) if author_el else None,
                 }
             )
 
+        questions.append(
+            {
+                "product_id": None,
+                "question": question_text,
+                "asked_at": asked_at,
+                "answers": answers,
+            }
+        )
+
     return questions
 
+def _parse_questions_from_html(html: str) -> List[Dict[str, Any]]:
+    # selectolax is optional; it only reads, so it never needs bs4's tree.
+    if LexborHTMLParser is None:
+        return _parse_questions_from_dom(BeautifulSoup(html, "lxml"))
+    return _lexbor_questions(html)
+
 def extract_questions(
-    soup: BeautifulSoup, product_json: Optional[Dict[str, Any]]
+    soup: DomSource, product_json: Optional[Dict[str, Any]]
 ) -> List[Dict[str, Any]]:
     """
     Extracts Q&A data for a product. When structured data is unavailable,
     falls back to DOM scraping heuristics and may return a best-effort
     approximation.
+
+    soup may also be the raw page HTML; the DOM fallback then runs on
+    selectolax when it is installed. It may also be a zero-argument callable
+    returning either, invoked only if the fallback is actually needed.
     """
     questions: List[Dict[str, Any]] = []
 
@@ -106,7 +153,11 @@ def extract_questions(
 
     if not questions:
         try:
-            questions.extend(_parse_questions_from_dom(soup))
+            dom = resolve_dom_source(soup)
+            if isinstance(dom, str):
+                questions.extend(_parse_questions_from_html(dom))
+            else:
+                questions.extend(_parse_questions_from_dom(dom))
         except Exception as e:
             logger.error("Failed to parse Q&A from DOM: %s", e)
 
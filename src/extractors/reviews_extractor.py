@@ -3,8 +3,18 @@ from typing import Any, Dict, List, Optional
 
 from bs4 import BeautifulSoup
 
+from ..utils.html_utils import DomSource, lexbor_text, resolve_dom_source
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
 logger = logging.getLogger(__name__)
 
+REVIEW_CONTAINER_TAGS = ["div", "li"]
+REVIEW_CONTAINER_DATA_AT = ["review", "ugc_review"]
+
 def _parse_reviews_from_json(product_json: Dict[str, Any]) -> List[Dict[str, Any]]:
     reviews = []
 
@@ -50,8 +60,7 @@ def _parse_reviews_from_dom(soup: BeautifulSoup) -> List[Dict[str, Any]]:
 
     # Heuristic DOM parsing for reviews section
     review_containers = soup.find_all(
-        lambda tag: tag.name in ("div", "li")
-        and tag.get("data-at") in ("review", "ugc_review")
+        REVIEW_CONTAINER_TAGS, attrs={"data-at": REVIEW_CONTAINER_DATA_AT}
     )
 
     for container in review_containers:
@@ -96,12 +105,62 @@ def _parse_reviews_from_dom(soup: BeautifulSoup) -> List[Dict[str, Any]]:
 
     return reviews
 
+def _lexbor_reviews(html: str) -> List[Dict[str, Any]]:
+    reviews: List[Dict[str, Any]] = []
+    tree = LexborHTMLParser(html)
+
+    selector = ", ".join(
+        f'{tag}[data-at="{data_at}"]'
+        for tag in REVIEW_CONTAINER_TAGS
+        for data_at in REVIEW_CONTAINER_DATA_AT
+    )
+    for container in tree.css(selector):
+        rating_el = container.css_first('[data-at="review_rating"]')
+        rating = _safe_float(lexbor_text(rating_el)) if rating_el else None
+
+        title_el = container.css_first('[data-at="review_title"]')
+        title = lexbor_text(title_el) if title_el else None
+
+        text_el = container.css_first('[data-at="review_text"]')
+        text = lexbor_text(text_el, " ") if text_el else None
+
+        nickname_el = container.css_first('[data-at="review_author_name"]')
+        nickname = lexbor_text(nickname_el) if nickname_el else None
+
+        date_el = container.css_first('[data-at="review_date"]')
+        submitted_at = lexbor_text(date_el) if date_el else None
+
+        if text or title:
+            reviews.append(
+                {
+                    "rating": rating,
+                    "review_text": text,
+                    "review_title": title,
+                    "submitted_at": submitted_at,
+                    "reviewer_info": {
+                        "nickname": nickname,
+                    },
+                }
+            )
+
+    return reviews
+
+def _parse_reviews_from_html(html: str) -> List[Dict[str, Any]]:
+    # selectolax is optional; it only reads, so it never needs bs4's tree.
+    if LexborHTMLParser is None:
+        return _parse_reviews_from_dom(BeautifulSoup(html, "lxml"))
+    return _lexbor_reviews(html)
+
 def extract_reviews(
-    soup: BeautifulSoup, product_json: Optional[Dict[str, Any]]
+    soup: DomSource, product_json: Optional[Dict[str, Any]]
 ) -> List[Dict[str, Any]]:
     """
     Extracts a list of review records from either structured JSON-LD or
     the rendered DOM, using resilient heuristics.
+
+    soup may also be the raw page HTML; the DOM fallback then runs on
+    selectolax when it is installed. It may also be a zero-argument callable
+    returning either, invoked only if the fallback is actually needed.
     """
     reviews: List[Dict[str, Any]] = []
 
@@ -114,7 +173,11 @@ def extract_reviews(
     # Fall back to scraping rendered HTML
     if not reviews:
         try:
-            reviews.extend(_parse_reviews_from_dom(soup))
+            dom = resolve_dom_source(soup)
+            if isinstance(dom, str):
+                reviews.extend(_parse_reviews_from_html(dom))
+            else:
+                reviews.extend(_parse_reviews_from_dom(dom))
         except Exception as e:
             logger.error("Failed to parse reviews from DOM: %s", e)
 
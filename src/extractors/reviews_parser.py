@@ -1,14 +1,35 @@
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import re
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
-from .utils_format import clean_text, parse_float, parse_int
+from .context import ParsedPage, as_parsed_page
+from .utils_format import (
+    clean_text,
+    index_data_at,
+    normalize_date,
+    parse_float,
+    parse_int,
+    siselect,
+)
 
 logger = logging.getLogger(__name__)
 
-def _parse_review_container(container: Tag) -> Dict[str, Any]:
+STAR_LABEL_RE = re.compile(r"out of 5")
+STAR_RATING_RE = re.compile(r"(\d+(?:\.\d+)?)\s*out of 5")
+
+def _find_star_span(container: Tag) -> Optional[Tag]:
+    # A compiled pattern is matched by bs4 directly, without a Python
+    # callback per <span>.
+    return container.find("span", attrs={"aria-label": STAR_LABEL_RE})
+
+def _parse_review_container(container: Tag) -> Optional[Dict[str, Any]]:
+    """
+    Parse one review container, or return None when it carries neither a
+    review_rating node nor an "out of 5" star label (i.e. is not a review).
+    """
     rating = 0.0
     title = ""
     text = ""
@@ -16,25 +37,28 @@ def _parse_review_container(container: Tag) -> Dict[str, Any]:
     submitted_at: Optional[str] = None
     helpful_vote_count = 0
     not_helpful_vote_count = 0
+    local_index = index_data_at(container)
 
-    rating_tag = container.find(attrs={"data-at": "review_rating"})
+    rating_tag = local_index.get("review_rating", [None])[0]
     if rating_tag:
         rating = parse_float(rating_tag.get_text(strip=True), default=0.0)
     else:
-        star_tag = container.find("span", attrs={"aria-label": True})
-        if star_tag and "out of 5" in star_tag["aria-label"]:
-            rating_text = star_tag["aria-label"].split("out of 5")[0]
-            rating = parse_float(rating_text, default=0.0)
-
-    title_tag = container.find(attrs={"data-at": "review_title"})
+        star_tag = _find_star_span(container)
+        if star_tag is None:
+            return None
+        rating_match = STAR_RATING_RE.search(star_tag["aria-label"])
+        if rating_match:
+            rating = float(rating_match.group(1))
+
+    title_tag = local_index.get("review_title", [None])[0]
     if title_tag:
         title = clean_text(title_tag.get_text(strip=True))
 
-    body_tag = container.find(attrs={"data-at": "review_body"})
+    body_tag = local_index.get("review_body", [None])[0]
     if body_tag:
         text = clean_text(body_tag.get_text(separator=" ", strip=True))
 
-    recommended_tag = container.find(attrs={"data-at": "review_recommendation"})
+    recommended_tag = local_index.get("review_recommendation", [None])[0]
     if recommended_tag:
         rec_text = recommended_tag.get_text(strip=True).lower()
         if "yes" in rec_text or "recommended" in rec_text:
@@ -42,16 +66,16 @@ def _parse_review_container(container: Tag) -> Dict[str, Any]:
         elif "no" in rec_text or "not recommended" in rec_text:
             is_recommended = False
 
-    date_tag = container.find(attrs={"data-at": "review_date"})
+    date_tag = local_index.get("review_date", [None])[0]
     if date_tag:
         raw_date = clean_text(date_tag.get_text(strip=True))
-        submitted_at = _normalize_date(raw_date)
+        submitted_at = normalize_date(raw_date)
 
-    helpful_tag = container.find(attrs={"data-at": "review_helpful_count"})
+    helpful_tag = local_index.get("review_helpful_count", [None])[0]
     if helpful_tag:
         helpful_vote_count = parse_int(helpful_tag.get_text(strip=True), default=0)
 
-    not_helpful_tag = container.find(attrs={"data-at": "review_not_helpful_count"})
+    not_helpful_tag = local_index.get("review_not_helpful_count", [None])[0]
     if not_helpful_tag:
         not_helpful_vote_count = parse_int(not_helpful_tag.get_text(strip=True), default=0)
 
@@ -66,50 +90,33 @@ def _parse_review_container(container: Tag) -> Dict[str, Any]:
     }
     return review
 
-def _normalize_date(text: str) -> Optional[str]:
-    """
-    Attempt to normalize a Sephora-style date into ISO8601.
-    """
-    formats = [
-        "%b %d, %Y",
-        "%B %d, %Y",
-        "%Y-%m-%d",
-    ]
-    for fmt in formats:
-        try:
-            dt = datetime.strptime(text, fmt)
-            return dt.isoformat()
-        except ValueError:
-            continue
-    return None
-
-def parse_reviews(soup: BeautifulSoup, max_reviews: Optional[int] = None) -> List[Dict[str, Any]]:
+def parse_reviews(
+    page: Union[ParsedPage, BeautifulSoup], max_reviews: Optional[int] = None
+) -> List[Dict[str, Any]]:
     """
     Parse reviews from Sephora product page HTML.
 
     Uses data-at attributes commonly used in Sephora markup, with a fallback
-    to generic container parsing.
+    to generic container parsing (which needs an unstrained soup).
     """
     logger.debug("Parsing reviews")
+    soup = as_parsed_page(page).soup
     reviews: List[Dict[str, Any]] = []
 
-    container_candidates = soup.select('[data-comp*="Review"]:not(script)')
-    if not container_candidates:
-        container_candidates = soup.find_all("article")
-    if not container_candidates:
-        container_candidates = soup.find_all("li")
+    # Lazy matching lets the max_reviews break stop the selector walk too.
+    matches = siselect(soup, '[data-comp*="Review"]:not(script)')
+    first_match = next(matches, None)
+    container_candidates: Iterable[Tag]
+    if first_match is not None:
+        container_candidates = chain((first_match,), matches)
+    else:
+        container_candidates = soup.find_all("article") or soup.find_all("li")
 
     for container in container_candidates:
         if not isinstance(container, Tag):
             continue
-        # Heuristic: skip containers that obviously do not contain a rating
-        if not container.find(attrs={"data-at": "review_rating"}) and not container.find(
-            "span", attrs={"aria-label": lambda v: v and "out of 5" in v}
-        ):
-            continue
-
         review = _parse_review_container(container)
-        if review["review_text"] or review["review_title"]:
+        if review and (review["review_text"] or review["review_title"]):
             reviews.append(review)
 
         if max_reviews is not None and len(reviews) >= max_reviews:
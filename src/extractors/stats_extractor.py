@@ -16,11 +16,11 @@ def build_statistics_from_reviews(reviews: List[Dict[str, Any]]) -> Dict[str, An
             "review_count": 0,
         }
 
-    ratings: List[float] = []
-    for r in reviews:
-        rating = r.get("rating")
-        if isinstance(rating, (int, float)):
-            ratings.append(float(rating))
+    ratings: List[float] = [
+        float(rating)
+        for rating in (r.get("rating") for r in reviews)
+        if isinstance(rating, (int, float))
+    ]
 
     average_rating: Optional[float] = (
         sum(ratings) / len(ratings) if ratings else None
@@ -0,0 +1,135 @@
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .utils_format import clean_text, normalize_date, parse_float, parse_int
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_API_URL = "https://api.bazaarvoice.com/data"
+DEFAULT_API_VERSION = "5.4"
+# The Conversations API rejects a Limit above 100.
+MAX_PAGE_SIZE = 100
+
+@dataclass(frozen=True)
+class UGCApiConfig:
+    """
+    Connection details for the Bazaarvoice Conversations API, the JSON
+    source the reviews and Q&A on Sephora product pages are rendered from.
+
+    Built from the "ugc_api" settings block, e.g.
+    {"ugc_api": {"passkey": "...", "page_size": 100}}; api_url and
+    api_version default to the public v5.4 endpoint.
+    """
+
+    passkey: str
+    api_url: str = DEFAULT_API_URL
+    api_version: str = DEFAULT_API_VERSION
+    page_size: int = MAX_PAGE_SIZE
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> Optional["UGCApiConfig"]:
+        block = settings.get("ugc_api") or {}
+        passkey = block.get("passkey")
+        if not passkey:
+            return None
+        return cls(
+            passkey=str(passkey),
+            api_url=str(block.get("api_url") or DEFAULT_API_URL).rstrip("/"),
+            api_version=str(block.get("api_version") or DEFAULT_API_VERSION),
+            page_size=max(1, min(parse_int(block.get("page_size"), default=MAX_PAGE_SIZE), MAX_PAGE_SIZE)),
+        )
+
+    @property
+    def reviews_url(self) -> str:
+        return f"{self.api_url}/reviews.json"
+
+    @property
+    def questions_url(self) -> str:
+        return f"{self.api_url}/questions.json"
+
+    def reviews_params(self, product_id: str, offset: int, limit: int) -> Dict[str, Any]:
+        return self._page_params(product_id, offset, limit)
+
+    def questions_params(self, product_id: str, offset: int, limit: int) -> Dict[str, Any]:
+        # Answers come back in the same response, under Includes.
+        params = self._page_params(product_id, offset, limit)
+        params["Include"] = "answers"
+        return params
+
+    def _page_params(self, product_id: str, offset: int, limit: int) -> Dict[str, Any]:
+        return {
+            "apiversion": self.api_version,
+            "passkey": self.passkey,
+            "Filter": f"ProductId:{product_id}",
+            "Offset": offset,
+            "Limit": min(limit, self.page_size),
+        }
+
+def page_results(payload: Any) -> Optional[Tuple[List[Dict[str, Any]], int]]:
+    """
+    The (Results, TotalResults) pair of one API response, or None when the
+    response is not a successful page (HasErrors set, or not an object).
+    """
+    if not isinstance(payload, dict) or payload.get("HasErrors"):
+        if isinstance(payload, dict):
+            logger.warning("UGC API returned errors: %s", payload.get("Errors"))
+        return None
+    results = payload.get("Results")
+    if not isinstance(results, list):
+        return None
+    return [r for r in results if isinstance(r, dict)], parse_int(payload.get("TotalResults"), default=0)
+
+def _api_date(value: Any) -> Optional[str]:
+    # SubmissionTime is a full ISO timestamp; the HTML parsers only ever see
+    # the day, so keep the two sources in the same format.
+    if not isinstance(value, str) or len(value) < 10:
+        return None
+    return normalize_date(value[:10])
+
+def review_from_api(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map one Conversations API review onto the record parse_reviews() builds.
+    """
+    is_recommended = result.get("IsRecommended")
+    return {
+        "rating": parse_float(result.get("Rating"), default=0.0),
+        "review_text": clean_text(result.get("ReviewText")),
+        "review_title": clean_text(result.get("Title")),
+        "is_recommended": is_recommended if isinstance(is_recommended, bool) else None,
+        "submitted_at": _api_date(result.get("SubmissionTime")),
+        "helpful_vote_count": parse_int(result.get("TotalPositiveFeedbackCount"), default=0),
+        "not_helpful_vote_count": parse_int(result.get("TotalNegativeFeedbackCount"), default=0),
+    }
+
+def questions_from_api(payload: Dict[str, Any], product_id: str) -> List[Dict[str, Any]]:
+    """
+    Map one Conversations API questions page (fetched with Include=answers)
+    onto the records parse_questions() builds.
+    """
+    answers_by_id = (payload.get("Includes") or {}).get("Answers") or {}
+    questions: List[Dict[str, Any]] = []
+    for result in payload.get("Results") or []:
+        if not isinstance(result, dict):
+            continue
+        answers: List[Dict[str, Any]] = []
+        for answer_id in result.get("AnswerIds") or []:
+            answer = answers_by_id.get(str(answer_id))
+            if isinstance(answer, dict):
+                answers.append(
+                    {
+                        "answer": clean_text(answer.get("AnswerText")),
+                        "submitted_at": _api_date(answer.get("SubmissionTime")),
+                    }
+                )
+        questions.append(
+            {
+                "product_id": product_id,
+                "question": clean_text(result.get("QuestionDetails") or result.get("QuestionSummary")),
+                "submitted_at": _api_date(result.get("SubmissionTime")),
+                "answers": answers,
+                "helpful_vote_count": parse_int(result.get("TotalPositiveFeedbackCount"), default=0),
+                "not_helpful_vote_count": parse_int(result.get("TotalNegativeFeedbackCount"), default=0),
+            }
+        )
+    return questions
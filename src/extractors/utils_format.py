@@ -1,15 +1,133 @@
+import functools
 import logging
-import re
-from typing import Any, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+import soupsieve
+from bs4 import SoupStrainer, Tag
 
 logger = logging.getLogger(__name__)
 
-NUMBER_WITH_SUFFIX_RE = re.compile(r"^\s*([\d.,]+)\s*([kKmM]?)\s*$")
-PRODUCT_ID_RE = re.compile(r"(P\d+)")
+CLEAN_TEXT_FAST_PATH_MIN = 64
+DATE_FORMATS = ("%b %d, %Y", "%B %d, %Y", "%Y-%m-%d")
+NUMBER_CHARS = "0123456789.,"
+NUMBER_SUFFIXES = {"k": 1_000, "m": 1_000_000}
+
+# Probe order for normalize_date; the last format that matched moves to the
+# front, since every review on a page tends to use the same one.
+_date_formats = DATE_FORMATS
+
+STRAINED_TAGS = ("meta", "script")
+STRAINED_DATA_COMPS = ("Review", "Question", "ProductVariant", "Histogram")
+
+def _is_relevant_tag(name: str, attrs: Optional[Dict[str, Any]]) -> bool:
+    if name in STRAINED_TAGS:
+        return True
+    if not attrs:
+        return False
+    if "data-at" in attrs:
+        return True
+    data_comp = attrs.get("data-comp")
+    if isinstance(data_comp, (list, tuple)):
+        data_comp = " ".join(data_comp)
+    return bool(data_comp) and any(c in data_comp for c in STRAINED_DATA_COMPS)
+
+class _ProductPageStrainer(SoupStrainer):
+    """
+    Keeps only the subtrees the product extractors query: <meta>, <script>,
+    anything carrying a data-at attribute, and Review/Question/ProductVariant/
+    Histogram components. Everything else is dropped before a Tag is built.
+    """
+
+    # beautifulsoup4 >= 4.13
+    @property
+    def includes_everything(self) -> bool:
+        return False
+
+    def allow_tag_creation(self, nsprefix: Optional[str], name: str, attrs: Any) -> bool:
+        return _is_relevant_tag(name, attrs)
+
+    def allow_string_creation(self, string: str) -> bool:
+        return False
+
+    # beautifulsoup4 < 4.13
+    def search_tag(self, markup_name: Any = None, markup_attrs: Any = None) -> bool:
+        if not isinstance(markup_name, str):
+            return False
+        return _is_relevant_tag(markup_name, dict(markup_attrs or {}))
+
+def build_strainer() -> SoupStrainer:
+    """
+    Build a SoupStrainer for BeautifulSoup(html, "lxml", parse_only=...) that
+    limits the tree to the product info, variant, statistics, review and
+    question markup.
+
+    Generic fallbacks that scan plain <section>, <article> or <li> tags (for
+    example the Q&A DOM fallback) do not see those tags in a strained soup;
+    pass an unstrained soup when they are needed.
+    """
+    return _ProductPageStrainer()
+
+@functools.lru_cache(maxsize=64)
+def _compiled(selector: str) -> soupsieve.SoupSieve:
+    return soupsieve.compile(selector)
+
+def sselect(node: Tag, selector: str) -> List[Tag]:
+    """
+    Equivalent of node.select(selector) that compiles each selector once.
+    """
+    return _compiled(selector).select(node)
+
+def sselect_one(node: Tag, selector: str) -> Optional[Tag]:
+    """
+    Equivalent of node.select_one(selector) that compiles each selector once.
+    """
+    return _compiled(selector).select_one(node)
+
+def siselect(node: Tag, selector: str) -> Iterator[Tag]:
+    """
+    Lazy counterpart of sselect(): matches are produced as the caller
+    consumes them, so breaking out of the loop also stops the tree walk.
+    """
+    return _compiled(selector).iselect(node)
+
+def index_data_at(root: Tag) -> Dict[str, List[Tag]]:
+    """
+    Bucket every descendant of root carrying a data-at attribute by its value,
+    in document order, with a single tree walk. index.get(key, [None])[0]
+    then matches root.find(attrs={"data-at": key}).
+    """
+    index: Dict[str, List[Tag]] = {}
+    for tag in root.find_all(attrs={"data-at": True}):
+        index.setdefault(tag["data-at"], []).append(tag)
+    return index
+
+def dig(data: Any, *keys: str) -> Any:
+    """
+    data[k1][k2]..., or None as soon as a level is missing or not an object.
+    """
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
 
 def clean_text(text: Optional[str]) -> str:
     if not text:
         return ""
+    # Review and answer bodies usually arrive already normalized from
+    # get_text(" ", strip=True). For long strings, confirming that with
+    # C-level scans is cheaper than splitting into a token list and joining
+    # it back. isprintable() is False for every whitespace character except
+    # the ASCII space.
+    if (
+        len(text) >= CLEAN_TEXT_FAST_PATH_MIN
+        and text.isprintable()
+        and "  " not in text
+        and text[0] != " "
+        and text[-1] != " "
+    ):
+        return text
     return " ".join(text.split())
 
 def parse_float(value: Any, default: float = 0.0) -> float:
@@ -17,9 +135,11 @@ def parse_float(value: Any, default: float = 0.0) -> float:
         return default
     if isinstance(value, (int, float)):
         return float(value)
+    # float() already ignores surrounding whitespace; only strings that are
+    # not str yet need the str() round trip.
+    text = value if isinstance(value, str) else str(value)
     try:
-        text = str(value).strip().replace(",", "")
-        return float(text)
+        return float(text.replace(",", ""))
     except (TypeError, ValueError):
         logger.debug("Unable to parse float from %r", value)
         return default
@@ -29,33 +149,70 @@ def parse_int(value: Any, default: int = 0) -> int:
         return default
     if isinstance(value, int):
         return value
+    text = value if isinstance(value, str) else str(value)
+    text = text.replace(",", "")
+    try:
+        return int(text)
+    except ValueError:
+        pass
     try:
-        text = str(value).strip().replace(",", "")
         return int(float(text))
-    except (TypeError, ValueError):
+    except (TypeError, ValueError, OverflowError):
         logger.debug("Unable to parse int from %r", value)
         return default
 
 def parse_number_with_suffix(text: Optional[str], default: int = 0) -> int:
+    """
+    Parse counts such as "73.4K" or "1,204" into an int, without a regex.
+    """
     if not text:
         return default
-    match = NUMBER_WITH_SUFFIX_RE.match(text)
-    if not match:
+    number_str = text.strip()
+    multiplier = NUMBER_SUFFIXES.get(number_str[-1:].lower())
+    if multiplier is not None:
+        number_str = number_str[:-1].rstrip()
+    # strip() with a character set is a C-level scan: anything left over is
+    # a character outside digits, "." and ",".
+    if not number_str or number_str.strip(NUMBER_CHARS):
         return default
-    number_str, suffix = match.groups()
     try:
         value = float(number_str.replace(",", ""))
     except ValueError:
         return default
-    suffix = suffix.lower()
-    if suffix == "k":
-        value *= 1_000
-    elif suffix == "m":
-        value *= 1_000_000
+    if multiplier is not None:
+        value *= multiplier
     return int(round(value))
 
 def infer_product_id_from_url(url: str) -> Optional[str]:
-    match = PRODUCT_ID_RE.search(url)
-    if match:
-        return match.group(1)
-    return None
\ No newline at end of file
+    """
+    Return the first "P<digits>" token in url (e.g. "P455369"), if any.
+    """
+    size = len(url)
+    start = url.find("P")
+    while start != -1:
+        end = start + 1
+        while end < size and url[end].isdigit():
+            end += 1
+        if end > start + 1:
+            return url[start:end]
+        start = url.find("P", end)
+    return None
+
+@functools.lru_cache(maxsize=4096)
+def normalize_date(text: str) -> Optional[str]:
+    """
+    Attempt to normalize a Sephora-style date into ISO8601.
+    """
+    global _date_formats
+    formats = _date_formats
+    for fmt in formats:
+        try:
+            dt = datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+        if fmt != formats[0]:
+            # Rebind rather than mutate so concurrent callers iterating the
+            # previous tuple are unaffected.
+            _date_formats = (fmt,) + tuple(f for f in formats if f != fmt)
+        return dt.isoformat()
+    return None
@@ -1,8 +1,19 @@
 import argparse
+import atexit
 import json
 import logging
+import os
+import queue
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
 
 from .parser.product_parser import ProductParser
 from .parser.category_parser import CategoryParser
@@ -12,12 +23,30 @@ from .outputs.dataset_exporter import DatasetExporter
 
 logger = logging.getLogger(__name__)
 
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s - %(message)s"
+# How many parsed product pages between two progress lines.
+PROGRESS_LOG_EVERY = 25
+
 def configure_logging(verbose: bool = False) -> None:
     level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
-    )
+    # Records are formatted and written to stderr by a listener thread, so
+    # the fetch/parse loop only pays for a queue put per message.
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    queue_handler = QueueHandler(log_queue)
+    # QueueHandler renders the message (and any traceback) before enqueueing;
+    # the listener's formatter adds the timestamp/level prefix.
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=level, handlers=[queue_handler])
+    listener.start()
+    atexit.register(listener.stop)
+
+def _init_parse_worker(level: int) -> None:
+    # Parse processes log straight to stderr: a forked copy of the parent's
+    # QueueHandler would feed a queue that no listener drains.
+    logging.basicConfig(level=level, format=LOG_FORMAT, force=True)
 
 def load_settings(project_root: Path) -> Dict[str, Any]:
     config_path = project_root / "src" / "config" / "settings.example.json"
@@ -55,17 +84,45 @@ def load_input_payload(input_path: Path) -> Dict[str, Any]:
 
     return payload
 
+def build_cached_session(settings: Dict[str, Any]) -> Optional["requests_cache.CachedSession"]:
+    """
+    Returns an on-disk (SQLite) caching session when settings name a
+    cache_path, so repeated runs skip re-downloading unchanged pages. Returns
+    None when caching is not configured or requests-cache is not installed.
+    """
+    cache_path = settings.get("cache_path")
+    if not cache_path:
+        return None
+    if requests_cache is None:
+        logger.warning("cache_path is set but requests-cache is not installed; caching disabled.")
+        return None
+    return requests_cache.CachedSession(
+        cache_name=cache_path,
+        backend="sqlite",
+        expire_after=int(settings.get("cache_ttl", 86400)),
+    )
+
 def dedupe_urls(urls: List[str]) -> List[str]:
-    seen: Set[str] = set()
-    result: List[str] = []
-    for u in urls:
-        u = u.strip()
-        if not u:
-            continue
-        if u not in seen:
-            seen.add(u)
-            result.append(u)
-    return result
+    # dict preserves insertion order, so this keeps the first occurrence.
+    return list(dict.fromkeys(u for u in map(str.strip, urls) if u))
+
+def _parse_worker(
+    html: str, url: str, include_similar: bool
+) -> Tuple[Dict[str, Any], List[str], Optional[str]]:
+    """
+    Runs in a parse process: parses one fetched product page, plus its
+    similar-product links when requested. A similar-link failure is returned
+    rather than raised so it does not discard the parsed record.
+    """
+    product_record = ProductParser().parse_product(html, source_url=url)
+    similar_links: List[str] = []
+    similar_error: Optional[str] = None
+    if include_similar:
+        try:
+            similar_links = SimilarProductsParser().extract_similar_product_links(html, base_url=url)
+        except Exception as e:
+            similar_error = str(e)
+    return product_record, similar_links, similar_error
 
 def main() -> None:
     parser = argparse.ArgumentParser(
@@ -123,66 +180,118 @@ def main() -> None:
     logger.info("Products: %d | Categories: %d | Include similar: %s",
                 len(product_urls), len(category_urls), include_similar)
 
+    max_workers = int(settings.get("max_workers") or settings.get("concurrent_requests") or 16)
+    parse_workers = int(settings.get("parse_workers") or os.cpu_count() or 1)
+
     request_helper = RequestHelper(
         default_headers=settings.get("default_headers") or {},
         timeout=float(settings.get("request_timeout", 20)),
         max_retries=int(settings.get("max_retries", 3)),
         backoff_factor=float(settings.get("backoff_factor", 0.5)),
+        pool_size=max_workers,
+        session=build_cached_session(settings),
     )
 
-    product_parser = ProductParser()
     category_parser = CategoryParser()
-    similar_parser = SimilarProductsParser()
 
     all_products: List[Dict[str, Any]] = []
-    processed_product_urls: Set[str] = set()
-
-    # Process category URLs -> product URLs
-    for category_url in category_urls:
-        logger.info("Fetching category page: %s", category_url)
-        category_html = request_helper.fetch_html(category_url)
-        if not category_html:
-            logger.error("Failed to retrieve category URL: %s", category_url)
-            continue
-        category_products = category_parser.extract_product_links(category_html, base_url=category_url)
-        logger.info("Discovered %d product URLs from category %s", len(category_products), category_url)
-        product_urls.extend(category_products)
-
-    product_urls = dedupe_urls(product_urls)
-
-    # Process product URLs
-    for url in product_urls:
-        if url in processed_product_urls:
-            logger.debug("Skipping duplicate product URL: %s", url)
-            continue
-
-        logger.info("Fetching product page: %s", url)
-        html = request_helper.fetch_html(url)
-        if not html:
-            logger.error("Failed to retrieve product URL: %s", url)
-            continue
-
-        try:
-            product_record = product_parser.parse_product(html, source_url=url)
-            if product_record:
-                all_products.append(product_record)
-                processed_product_urls.add(url)
-                logger.info("Parsed product: %s", product_record.get("info", {}).get("name") or url)
-            else:
-                logger.warning("Product parser returned empty record for %s", url)
-        except Exception as e:
-            logger.exception("Error parsing product %s: %s", url, e)
-            continue
-
-        if include_similar:
-            try:
-                similar_links = similar_parser.extract_similar_product_links(html, base_url=url)
+    # Every product URL ever queued, whether or not it later parsed. Category
+    # and similar-product links are checked against it as they are found, so
+    # no pass ever re-dedupes the whole list and each URL is queued once.
+    queued_product_urls: Set[str] = set(product_urls)
+    product_queue: Deque[str] = deque(product_urls)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor, ProcessPoolExecutor(
+        max_workers=parse_workers,
+        initializer=_init_parse_worker,
+        initargs=(logging.getLogger().level,),
+    ) as parse_pool:
+        # Process category URLs -> product URLs
+        category_pages = executor.map(request_helper.fetch_html, category_urls)
+        for category_url, category_html in zip(category_urls, category_pages):
+            logger.info("Fetched category page: %s", category_url)
+            if not category_html:
+                logger.error("Failed to retrieve category URL: %s", category_url)
+                continue
+            category_products = category_parser.extract_product_links(category_html, base_url=category_url)
+            logger.info("Discovered %d product URLs from category %s", len(category_products), category_url)
+            for c_url in category_products:
+                c_url = c_url.strip()
+                if c_url and c_url not in queued_product_urls:
+                    queued_product_urls.add(c_url)
+                    product_queue.append(c_url)
+
+        # Process product URLs. Fetches overlap in the thread pool and every
+        # fetched page is parsed in the process pool, so parsing uses all cores
+        # and never stalls the fetch loop. Similar-product links come back with
+        # the parse result and are fed into the queue until nothing is left in
+        # flight. Records are keyed by queue position so the export order does
+        # not depend on which response arrives first.
+        fetching: Dict[Future, Tuple[int, str]] = {}
+        parsing: Dict[Future, Tuple[int, str]] = {}
+        records: Dict[int, Dict[str, Any]] = {}
+        next_position = 0
+        parsed_pages = 0
+        log_debug = logger.isEnabledFor(logging.DEBUG)
+
+        while True:
+            # Bounding fetched-but-unparsed pages too keeps memory flat when
+            # parsing falls behind the network.
+            while product_queue and len(fetching) + len(parsing) < max_workers * 2:
+                url = product_queue.popleft()
+                if log_debug:
+                    logger.debug("Fetching product page: %s", url)
+                fetching[executor.submit(request_helper.fetch_html, url)] = (next_position, url)
+                next_position += 1
+
+            if not fetching and not parsing:
+                break
+
+            done, _ = wait([*fetching, *parsing], return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in fetching:
+                    position, url = fetching.pop(future)
+                    html = future.result()
+                    if not html:
+                        logger.error("Failed to retrieve product URL: %s", url)
+                        continue
+                    parsing[parse_pool.submit(_parse_worker, html, url, include_similar)] = (position, url)
+                    continue
+
+                position, url = parsing.pop(future)
+                parsed_pages += 1
+                if parsed_pages % PROGRESS_LOG_EVERY == 0:
+                    logger.info(
+                        "Progress: %d product pages parsed, %d records, %d queued",
+                        parsed_pages,
+                        len(records),
+                        len(product_queue),
+                    )
+                try:
+                    product_record, similar_links, similar_error = future.result()
+                except Exception as e:
+                    logger.exception("Error parsing product %s: %s", url, e)
+                    continue
+
+                if product_record:
+                    records[position] = product_record
+                    logger.info("Parsed product: %s", product_record.get("info", {}).get("name") or url)
+                else:
+                    logger.warning("Product parser returned empty record for %s", url)
+
+                if similar_error is not None:
+                    logger.error("Failed to extract similar products for %s: %s", url, similar_error)
                 for s_url in similar_links:
-                    if s_url not in processed_product_urls:
+                    if s_url in queued_product_urls:
+                        if log_debug:
+                            logger.debug("Skipping duplicate product URL: %s", s_url)
+                        continue
+                    if log_debug:
                         logger.debug("Queued similar product URL: %s", s_url)
-                        product_urls.append(s_url)
-            except Exception as e:
-                logger.error("Failed to extract similar products for %s: %s", url, e)
+                    queued_product_urls.add(s_url)
+                    product_queue.append(s_url)
+
+    all_products.extend(records[position] for position in sorted(records))
 
     if not all_products:
         logger.warning("No products were successfully scraped. Exiting without export.")
@@ -1,119 +1,219 @@
 import csv
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from types import TracebackType
+from typing import Any, Dict, IO, Iterable, List, Optional, Type
+
+from .dataset_exporter import JSONArrayWriter
 
 logger = logging.getLogger(__name__)
 
+CSV_KEYS = ["info.id", "info.name", "info.brand", "info.price", "statistics.average_rating", "statistics.review_count"]
+
+HTML_HEAD = (
+    "<!DOCTYPE html><html><head><meta charset='utf-8'>"
+    "<title>Sephora Advanced Scraper Output</title>"
+    "<style>table{border-collapse:collapse;width:100%;}"
+    "th,td{border:1px solid #ddd;padding:8px;font-family:Arial, sans-serif;font-size:14px;}"
+    "th{background-color:#f4f4f4;text-align:left;}</style>"
+    "</head><body>"
+    "<h1>Sephora Advanced Scraper Output</h1>"
+    "<table>"
+    "<thead><tr>"
+    "<th>ID</th><th>Name</th><th>Brand</th><th>Price</th><th>Average Rating</th><th>Review Count</th>"
+    "</tr></thead>"
+    "<tbody>"
+)
+HTML_TAIL = "</tbody></table></body></html>"
+
 def _ensure_parent_dir(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
+def _partial_path(path: Path) -> Path:
+    return path.with_name(path.name + ".part")
+
+def _finish(partial: Path, path: Path, commit: bool) -> None:
+    # Output is written beside the target and only moved over it once
+    # complete, so an existing export survives an empty or failed run.
+    if commit:
+        os.replace(partial, path)
+    else:
+        partial.unlink(missing_ok=True)
+
 def _serialize_cell(value: Any) -> str:
     if isinstance(value, (str, int, float, bool)) or value is None:
         return "" if value is None else str(value)
     return json.dumps(value, ensure_ascii=False)
 
-def export_json(dataset: List[Dict[str, Any]], path: Path) -> None:
+def _summary_cells(item: Dict[str, Any]) -> List[str]:
+    # The high-level columns shared by the CSV and HTML exports, in CSV_KEYS order.
+    info = item.get("info", {})
+    stats = item.get("statistics", {})
+    return [
+        _serialize_cell(info.get("id")),
+        _serialize_cell(info.get("name")),
+        _serialize_cell(info.get("brand")),
+        _serialize_cell(info.get("price")),
+        _serialize_cell(stats.get("average_rating")),
+        _serialize_cell(stats.get("review_count")),
+    ]
+
+class _JSONSink:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._partial = _partial_path(path)
+        self._f = self._partial.open("wb")
+        self._writer = JSONArrayWriter(self._f)
+
+    def write(self, item: Dict[str, Any]) -> None:
+        self._writer.write(item)
+
+    def close(self, commit: bool = True) -> None:
+        self._writer.close()
+        self._f.close()
+        _finish(self._partial, self.path, commit)
+        if commit:
+            logger.info("Exported JSON dataset to %s", self.path)
+
+class _CSVSink:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._partial = _partial_path(path)
+        self._f: IO[str] = self._partial.open("w", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._f)
+        self._writer.writerow(CSV_KEYS)
+
+    def write(self, item: Dict[str, Any]) -> None:
+        self._writer.writerow(_summary_cells(item))
+
+    def close(self, commit: bool = True) -> None:
+        self._f.close()
+        _finish(self._partial, self.path, commit)
+        if commit:
+            logger.info("Exported CSV dataset to %s", self.path)
+
+class _HTMLSink:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._partial = _partial_path(path)
+        self._f: IO[str] = self._partial.open("w", encoding="utf-8")
+        self._f.write(HTML_HEAD)
+
+    def write(self, item: Dict[str, Any]) -> None:
+        self._f.write("<tr>" + "".join(f"<td>{cell}</td>" for cell in _summary_cells(item)) + "</tr>")
+
+    def close(self, commit: bool = True) -> None:
+        self._f.write(HTML_TAIL)
+        self._f.close()
+        _finish(self._partial, self.path, commit)
+        if commit:
+            logger.info("Exported HTML dataset to %s", self.path)
+
+_SINKS = {
+    "json": (_JSONSink, ".json"),
+    "csv": (_CSVSink, ".csv"),
+    "html": (_HTMLSink, ".html"),
+    "htm": (_HTMLSink, ".html"),
+}
+
+def _write_all(sink: Any, dataset: Iterable[Dict[str, Any]]) -> None:
+    try:
+        for item in dataset:
+            sink.write(item)
+    except BaseException:
+        sink.close(commit=False)
+        raise
+    sink.close()
+
+def export_json(dataset: Iterable[Dict[str, Any]], path: Path) -> None:
     _ensure_parent_dir(path)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(dataset, f, ensure_ascii=False, indent=2)
-    logger.info("Exported JSON dataset to %s", path)
+    _write_all(_JSONSink(path), dataset)
 
-def export_csv(dataset: List[Dict[str, Any]], path: Path) -> None:
+def export_csv(dataset: Iterable[Dict[str, Any]], path: Path) -> None:
     """
     Export a flattened view of the dataset to CSV.
 
     Nested structures (variants, reviews, questions) are serialized as JSON.
     """
     _ensure_parent_dir(path)
-    if not dataset:
-        with path.open("w", encoding="utf-8", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["info.id", "info.name", "info.brand"])
-        logger.info("Exported empty CSV dataset to %s", path)
-        return
-
-    keys = ["info.id", "info.name", "info.brand", "info.price", "statistics.average_rating", "statistics.review_count"]
-
-    with path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(keys)
-        for item in dataset:
-            info = item.get("info", {})
-            stats = item.get("statistics", {})
-            row = [
-                _serialize_cell(info.get("id")),
-                _serialize_cell(info.get("name")),
-                _serialize_cell(info.get("brand")),
-                _serialize_cell(info.get("price")),
-                _serialize_cell(stats.get("average_rating")),
-                _serialize_cell(stats.get("review_count")),
-            ]
-            writer.writerow(row)
-
-    logger.info("Exported CSV dataset to %s", path)
-
-def export_html(dataset: List[Dict[str, Any]], path: Path) -> None:
+    _write_all(_CSVSink(path), dataset)
+
+def export_html(dataset: Iterable[Dict[str, Any]], path: Path) -> None:
     """
     Export a simple HTML table with high-level product information.
     """
     _ensure_parent_dir(path)
+    _write_all(_HTMLSink(path), dataset)
 
-    rows_html: List[str] = []
-    for item in dataset:
-        info = item.get("info", {})
-        stats = item.get("statistics", {})
-        rows_html.append(
-            "<tr>"
-            f"<td>{_serialize_cell(info.get('id'))}</td>"
-            f"<td>{_serialize_cell(info.get('name'))}</td>"
-            f"<td>{_serialize_cell(info.get('brand'))}</td>"
-            f"<td>{_serialize_cell(info.get('price'))}</td>"
-            f"<td>{_serialize_cell(stats.get('average_rating'))}</td>"
-            f"<td>{_serialize_cell(stats.get('review_count'))}</td>"
-            "</tr>"
-        )
-
-    html = (
-        "<!DOCTYPE html><html><head><meta charset='utf-8'>"
-        "<title>Sephora Advanced Scraper Output</title>"
-        "<style>table{border-collapse:collapse;width:100%;}"
-        "th,td{border:1px solid #ddd;padding:8px;font-family:Arial, sans-serif;font-size:14px;}"
-        "th{background-color:#f4f4f4;text-align:left;}</style>"
-        "</head><body>"
-        "<h1>Sephora Advanced Scraper Output</h1>"
-        "<table>"
-        "<thead><tr>"
-        "<th>ID</th><th>Name</th><th>Brand</th><th>Price</th><th>Average Rating</th><th>Review Count</th>"
-        "</tr></thead>"
-        "<tbody>"
-        + "".join(rows_html)
-        + "</tbody></table></body></html>"
-    )
-
-    with path.open("w", encoding="utf-8") as f:
-        f.write(html)
-
-    logger.info("Exported HTML dataset to %s", path)
-
-def export_dataset(dataset: List[Dict[str, Any]], output_path: Path, formats: Iterable[str]) -> None:
+class StreamingDatasetWriter:
+    """
+    Writes records to every requested export format as they arrive, so a
+    scrape never has to hold its whole dataset in memory.
+
+    Use as a context manager: each output is started in a ".part" file
+    beside its target on entry, write() appends one record to all of them,
+    and exit closes the JSON array and the HTML table and moves the files
+    into place. If nothing was written, or the block raised, the partial
+    files are discarded and any previous export is left as it was.
+
+    output_path is treated as the base path; the extension will be adjusted per format.
+    """
+
+    def __init__(self, output_path: Path, formats: Iterable[str]) -> None:
+        base = output_path
+        if base.suffix:
+            base = base.with_suffix("")
+        self.base = base
+        self.formats = [f.lower().strip() for f in formats]
+        self.count = 0
+        self._sinks: List[Any] = []
+
+    def __enter__(self) -> "StreamingDatasetWriter":
+        try:
+            for fmt in self.formats:
+                if fmt not in _SINKS:
+                    logger.warning("Unsupported export format: %s", fmt)
+                    continue
+                sink_cls, suffix = _SINKS[fmt]
+                path = self.base.with_suffix(suffix)
+                if any(sink.path == path for sink in self._sinks):
+                    # e.g. both "html" and "htm": one file, written once.
+                    continue
+                _ensure_parent_dir(path)
+                self._sinks.append(sink_cls(path))
+        except BaseException:
+            self.close(commit=False)
+            raise
+        return self
+
+    def write(self, item: Dict[str, Any]) -> None:
+        for sink in self._sinks:
+            sink.write(item)
+        self.count += 1
+
+    def close(self, commit: bool = True) -> None:
+        sinks, self._sinks = self._sinks, []
+        for sink in sinks:
+            sink.close(commit=commit)
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        # A run that raised keeps the previous export, as _write_all does.
+        self.close(commit=exc_type is None and self.count > 0)
+
+def export_dataset(dataset: Iterable[Dict[str, Any]], output_path: Path, formats: Iterable[str]) -> None:
     """
     Export dataset in one or more formats based on the formats iterable.
 
     output_path is treated as the base path; the extension will be adjusted per format.
+    The dataset is iterated once, so it may be a generator.
     """
-    formats_clean = [f.lower().strip() for f in formats]
-    base = output_path
-    if base.suffix:
-        base = base.with_suffix("")
-
-    for fmt in formats_clean:
-        if fmt == "json":
-            export_json(dataset, base.with_suffix(".json"))
-        elif fmt == "csv":
-            export_csv(dataset, base.with_suffix(".csv"))
-        elif fmt in {"html", "htm"}:
-            export_html(dataset, base.with_suffix(".html"))
-        else:
-            logger.warning("Unsupported export format: %s", fmt)
\ No newline at end of file
+    with StreamingDatasetWriter(output_path, formats) as writer:
+        for item in dataset:
+            writer.write(item)
@@ -1,19 +1,82 @@
 import csv
 import json
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_INFO_KEYS = ("id", "name", "brand", "price", "is_available", "love_count", "image")
+_STATS_KEYS = (
+    "average_rating",
+    "review_count",
+    "helpful_vote_count",
+    "not_helpful_vote_count",
+    "recommended_review_count",
+)
+_EMPTY: Dict[str, Any] = {}
+CSV_FIELDNAMES = _INFO_KEYS + _STATS_KEYS + ("source_url",)
+CSV_BUFFER_SIZE = 1 << 20
+
+def _dump_record(record: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(record, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # orjson.JSONEncodeError: e.g. an int wider than 64 bits or a
+            # non-str key, both of which json handles.
+            pass
+    return json.dumps(record, ensure_ascii=False, indent=2).encode("utf-8")
+
+class JSONArrayWriter:
+    """
+    Appends records to a binary file as a JSON array laid out like
+    json.dump(..., indent=2), serializing one record at a time so the full
+    document is never held in memory. close() writes the closing bracket;
+    the file itself stays open.
+
+    With orjson installed the layout matches but some values are spelled
+    differently (1e+20 rather than 1e20, null for NaN); records orjson
+    cannot encode fall back to json.dumps.
+    """
+
+    def __init__(self, f: BinaryIO) -> None:
+        self._f = f
+        self.count = 0
+        f.write(b"[")
+
+    def write(self, record: Dict[str, Any]) -> None:
+        self._f.write(b",\n  " if self.count else b"\n  ")
+        # JSON strings cannot contain raw newlines, so indenting every line
+        # of the record by two spaces nests it inside the array.
+        self._f.write(_dump_record(record).replace(b"\n", b"\n  "))
+        self.count += 1
+
+    def close(self) -> None:
+        self._f.write(b"\n]" if self.count else b"]")
+
+def write_json_array(records: Iterable[Dict[str, Any]], f: BinaryIO) -> None:
+    """
+    Writes records to a binary file through a JSONArrayWriter.
+    """
+    writer = JSONArrayWriter(f)
+    for record in records:
+        writer.write(record)
+    writer.close()
 
 class DatasetExporter:
     """
     Handles exporting structured product data into JSON and CSV formats.
     """
 
-    def export_to_json(self, products: List[Dict[str, Any]], path: Path) -> None:
+    def export_to_json(self, products: Iterable[Dict[str, Any]], path: Path) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(products, f, ensure_ascii=False, indent=2)
+        with path.open("wb") as f:
+            write_json_array(products, f)
 
-    def export_to_csv(self, products: List[Dict[str, Any]], path: Path) -> None:
+    def export_to_csv(self, products: Iterable[Dict[str, Any]], path: Path) -> None:
         """
         Flattens nested product records into a simple row-per-product CSV.
         Only top-level info and basic statistics are included to keep the
@@ -21,32 +84,24 @@ class DatasetExporter:
         """
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        rows: List[Dict[str, Any]] = []
+        # Rows are produced lazily, so only one flattened row exists at a time;
+        # a large write buffer batches the many short rows into few syscalls.
+        with path.open("w", encoding="utf-8", newline="", buffering=CSV_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_FIELDNAMES)
+            writer.writerows(self._iter_csv_rows(products))
+
+    @staticmethod
+    def _iter_csv_rows(products: Iterable[Dict[str, Any]]) -> Iterator[Tuple[Any, ...]]:
+        # Positional rows in CSV_FIELDNAMES order; csv.writer renders None as
+        # an empty cell, exactly as DictWriter did.
         for product in products:
-            info = product.get("info", {}) or {}
-            stats = product.get("statistics", {}) or {}
-
-            row: Dict[str, Any] = {
-                "id": info.get("id"),
-                "name": info.get("name"),
-                "brand": info.get("brand"),
-                "price": info.get("price"),
-                "is_available": info.get("is_available"),
-                "love_count": info.get("love_count"),
-                "image": info.get("image"),
-                "average_rating": stats.get("average_rating"),
-                "review_count": stats.get("review_count"),
-                "helpful_vote_count": stats.get("helpful_vote_count"),
-                "not_helpful_vote_count": stats.get("not_helpful_vote_count"),
-                "recommended_review_count": stats.get("recommended_review_count"),
-                "source_url": (product.get("_source") or {}).get("url"),
-            }
-            rows.append(row)
-
-        fieldnames = list(rows[0].keys()) if rows else []
-
-        with path.open("w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for row in rows:
-                writer.writerow(row)
\ No newline at end of file
+            info = product.get("info") or _EMPTY
+            stats = product.get("statistics") or _EMPTY
+            source = product.get("_source") or _EMPTY
+
+            yield (
+                *map(info.get, _INFO_KEYS),
+                *map(stats.get, _STATS_KEYS),
+                source.get("url"),
+            )
\ No newline at end of file
@@ -1,11 +1,40 @@
 import logging
-from typing import List
+from typing import Iterator, List
 from urllib.parse import urljoin, urlparse
 
-from bs4 import BeautifulSoup
+from lxml import etree
 
 logger = logging.getLogger(__name__)
 
+# Listing pages are fed to the pull parser in slices of this many characters.
+FEED_CHUNK_SIZE = 64 * 1024
+
+def _drain_product_hrefs(parser: etree.HTMLPullParser) -> Iterator[str]:
+    for _, anchor in parser.read_events():
+        href = anchor.get("href")
+        # Heuristics: product URLs often contain "/product/" and product IDs
+        if href and "/product/" in href:
+            yield href
+        # The anchor's text and children are never needed; drop them now.
+        anchor.clear()
+
+def _iter_product_hrefs(html: str) -> Iterator[str]:
+    """
+    Streams product hrefs out of a listing page. The page is fed to lxml's
+    pull parser in slices and each <a> is reported as soon as it closes, so
+    link extraction overlaps parsing and no full DOM query is run.
+    """
+    parser = etree.HTMLPullParser(events=("end",), tag="a")
+    for offset in range(0, len(html), FEED_CHUNK_SIZE):
+        parser.feed(html[offset:offset + FEED_CHUNK_SIZE])
+        yield from _drain_product_hrefs(parser)
+    try:
+        parser.close()
+    except etree.XMLSyntaxError:
+        # Raised for documents with no content at all.
+        return
+    yield from _drain_product_hrefs(parser)
+
 class CategoryParser:
     """
     Parses Sephora category/listing pages and extracts product detail links.
@@ -14,29 +43,11 @@ class CategoryParser:
     """
 
     def extract_product_links(self, html: str, base_url: str) -> List[str]:
-        soup = BeautifulSoup(html, "html.parser")
-        links: List[str] = []
-
-        # Common Sephora patterns
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            if not href:
-                continue
-
-            # Normalize to absolute
-            full_url = urljoin(base_url, href)
-
-            # Heuristics: product URLs often contain "/product/" and product IDs
-            if "/product/" in full_url:
-                links.append(full_url)
+        # Normalize to absolute
+        links: List[str] = [urljoin(base_url, href) for href in _iter_product_hrefs(html)]
 
         # Deduplicate while preserving order
-        seen = set()
-        unique_links: List[str] = []
-        for link in links:
-            if link not in seen:
-                seen.add(link)
-                unique_links.append(link)
+        unique_links: List[str] = list(dict.fromkeys(links))
 
         logger.debug("Extracted %d unique product links from category page.", len(unique_links))
         return unique_links
\ No newline at end of file
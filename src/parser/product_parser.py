@@ -1,20 +1,34 @@
 import logging
-from dataclasses import dataclass, asdict
-from typing import Any, Dict, List, Optional
+import re
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from bs4 import BeautifulSoup
 
 from ..utils.html_utils import (
-    extract_json_ld_objects,
-    extract_meta_tag,
+    MetaIndex,
+    extract_json_ld_from_html,
     extract_numeric_from_text,
+    index_meta_tags_from_html,
+    meta_content,
 )
-from ..extractors.reviews_extractor import extract_reviews
+from ..extractors.reviews_extractor import LexborHTMLParser, extract_reviews
 from ..extractors.questions_extractor import extract_questions
 from ..extractors.stats_extractor import build_statistics_from_reviews
 
 logger = logging.getLogger(__name__)
 
+# Sephora products often have IDs like "P455369" in URL
+_PRODUCT_ID_RE = re.compile(r"/(P\d+)")
+_OUT_OF_STOCK_RE = re.compile(r"out of stock|sold out", re.IGNORECASE)
+# The same phrases in raw markup, where tags may split them across elements
+# ("Out of <b>stock</b>"). Some whitespace or a tag must separate the words,
+# so the isOutOfStock/OutOfStock keys in page JSON do not count.
+_TAGS_BETWEEN = r"(?:\s|<[^>]*>)+"
+_OUT_OF_STOCK_HINT_RE = re.compile(
+    rf"out{_TAGS_BETWEEN}of{_TAGS_BETWEEN}stock|sold{_TAGS_BETWEEN}out", re.IGNORECASE
+)
+
 @dataclass
 class ProductInfo:
     id: Optional[str] = None
@@ -34,6 +48,39 @@ class ProductVariant:
     variant_name: Optional[str] = None
     variant_image: Optional[str] = None
 
+# Both dataclasses hold only flat primitive fields, so a shallow dict is
+# identical to asdict() without its recursive deepcopy of every value.
+_INFO_FIELDS = tuple(f.name for f in fields(ProductInfo))
+_VARIANT_FIELDS = tuple(f.name for f in fields(ProductVariant))
+
+def _shallow_asdict(obj: Any, field_names: Tuple[str, ...]) -> Dict[str, Any]:
+    return {name: getattr(obj, name) for name in field_names}
+
+class _LazySoup:
+    """
+    The page's BeautifulSoup tree, built on first use only. JSON-LD and
+    <meta> tags are read from the raw HTML, so pages they fully describe
+    never pay for a tree.
+    """
+
+    def __init__(self, html: str) -> None:
+        self.html = html
+        self._soup: Optional[BeautifulSoup] = None
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.html, "lxml")
+        return self._soup
+
+    def dom_source(self) -> Union[BeautifulSoup, str]:
+        # The review/Q&A extractors only touch the DOM when JSON-LD has no
+        # entries, and accept raw HTML for their selectolax path. Without
+        # selectolax they would each build a soup, so share this one instead.
+        if self._soup is None and LexborHTMLParser is not None:
+            return self.html
+        return self.soup
+
 class ProductParser:
     """
     High-level product parser that coordinates HTML/JSON-LD parsing and delegates
@@ -41,20 +88,20 @@ class ProductParser:
     """
 
     def parse_product(self, html: str, source_url: str) -> Dict[str, Any]:
-        soup = BeautifulSoup(html, "html.parser")
+        page = _LazySoup(html)
 
-        json_ld_objects = extract_json_ld_objects(soup)
+        json_ld_objects = extract_json_ld_from_html(html)
         product_json = self._find_product_json(json_ld_objects)
 
-        info = self._build_product_info(soup, product_json, source_url)
+        info = self._build_product_info(page, index_meta_tags_from_html(html), product_json, source_url)
         variants = self._build_variants(product_json)
-        reviews = extract_reviews(soup, product_json)
-        questions = extract_questions(soup, product_json)
+        reviews = extract_reviews(page.dom_source, product_json)
+        questions = extract_questions(page.dom_source, product_json)
         statistics = build_statistics_from_reviews(reviews)
 
         product_record: Dict[str, Any] = {
-            "info": asdict(info),
-            "product_variants": [asdict(v) for v in variants],
+            "info": _shallow_asdict(info, _INFO_FIELDS),
+            "product_variants": [_shallow_asdict(v, _VARIANT_FIELDS) for v in variants],
             "statistics": statistics,
             "reviews": reviews,
             "questions": questions,
@@ -77,7 +124,8 @@ class ProductParser:
 
     def _build_product_info(
         self,
-        soup: BeautifulSoup,
+        page: _LazySoup,
+        meta_index: MetaIndex,
         product_json: Optional[Dict[str, Any]],
         source_url: str,
     ) -> ProductInfo:
@@ -109,40 +157,33 @@ class ProductParser:
 
         # Fallbacks from meta tags
         if not info.name:
-            info.name = extract_meta_tag(soup, property="og:title") or extract_meta_tag(
-                soup, name="title"
+            info.name = meta_content(meta_index, property="og:title") or meta_content(
+                meta_index, name="title"
             )
         if not info.image:
-            info.image = extract_meta_tag(soup, property="og:image")
+            info.image = meta_content(meta_index, property="og:image")
         if not info.description:
-            info.description = extract_meta_tag(soup, name="description")
+            info.description = meta_content(meta_index, name="description")
 
         # Sephora-specific "loves" count often shows as "XXK loves"
-        love_text = extract_meta_tag(soup, name="twitter:data2") or ""
+        love_text = meta_content(meta_index, name="twitter:data2") or ""
         love_number = extract_numeric_from_text(love_text)
         if love_number:
             info.love_count = love_number
 
         # Availability heuristic if not set
         if info.is_available is None:
-            body_text = soup.get_text(separator=" ", strip=True).lower()
-            if "out of stock" in body_text or "sold out" in body_text:
-                info.is_available = False
-            else:
-                info.is_available = True
+            info.is_available = not self._has_out_of_stock_text(page)
 
         # Derive ID from URL if missing
         if not info.id:
-            # Sephora products often have IDs like "P455369" in URL
-            import re
-
-            match = re.search(r"/(P\d+)", source_url)
+            match = _PRODUCT_ID_RE.search(source_url)
             if match:
                 info.id = match.group(1)
 
         # Brand fallback
         if not info.brand:
-            info.brand = extract_meta_tag(soup, property="og:site_name") or "Sephora"
+            info.brand = meta_content(meta_index, property="og:site_name") or "Sephora"
 
         return info
 
@@ -178,6 +219,16 @@ class ProductParser:
 
         return variants
 
+    @staticmethod
+    def _has_out_of_stock_text(page: _LazySoup) -> bool:
+        # A regex over the raw markup rules out pages that never mention it
+        # without building the tree. A hit may sit inside a <script> blob, so
+        # it is confirmed against the page's joined text, which also finds
+        # the phrase across inline tags.
+        if not _OUT_OF_STOCK_HINT_RE.search(page.html):
+            return False
+        return bool(_OUT_OF_STOCK_RE.search(page.soup.get_text(separator=" ", strip=True)))
+
     @staticmethod
     def _is_offer_available(offer: Dict[str, Any]) -> Optional[bool]:
         availability = offer.get("availability")
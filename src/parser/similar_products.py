@@ -2,10 +2,34 @@ import logging
 from typing import List
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+from lxml import etree
+
+from ..utils.html_utils import parse_lxml_tree
 
 logger = logging.getLogger(__name__)
 
+RECOMMENDATION_KEYWORDS = ("you may also like", "similar", "recommended", "more like this")
+
+# Every <section>/<div> whose text carries recommendation copy matches the
+# heuristic. An inner container's text is part of its outer container's, and
+# its links are too, so only outermost containers need to be tested. Their
+# subtrees are disjoint, which makes this a single pass over the document
+# instead of a get_text() per nested section.
+RECOMMENDATION_CANDIDATE_XPATH = etree.XPath(
+    "//*[self::section or self::div][not(ancestor::section or ancestor::div)]"
+)
+# The strings get_text() would join: script/style/template contents are skipped.
+VISIBLE_TEXT_XPATH = etree.XPath(
+    ".//text()[not(ancestor::script or ancestor::style or ancestor::template)]"
+)
+SECTION_HREF_XPATH = etree.XPath(".//a/@href")
+
+def _joined_text(element: etree._Element) -> str:
+    # Equivalent of get_text(" ", strip=True).lower(), so a keyword split
+    # across inline tags ("You may <em>also</em> like") still matches.
+    parts = (text.strip() for text in VISIBLE_TEXT_XPATH(element))
+    return " ".join(part for part in parts if part).lower()
+
 class SimilarProductsParser:
     """
     Parses a product detail page and attempts to extract links to similar or
@@ -13,33 +37,23 @@ class SimilarProductsParser:
     """
 
     def extract_similar_product_links(self, html: str, base_url: str) -> List[str]:
-        soup = BeautifulSoup(html, "html.parser")
+        tree = parse_lxml_tree(html)
+        if tree is None:
+            return []
         links: List[str] = []
 
-        # Look for sections that contain recommendation copy
-        candidate_sections = []
-        keywords = ["you may also like", "similar", "recommended", "more like this"]
-
-        for section in soup.find_all(["section", "div"]):
-            text = section.get_text(" ", strip=True).lower()
-            if any(k in text for k in keywords):
-                candidate_sections.append(section)
-
-        for section in candidate_sections:
-            for a in section.find_all("a", href=True):
-                href = a["href"]
+        for section in RECOMMENDATION_CANDIDATE_XPATH(tree):
+            text = _joined_text(section)
+            if not any(k in text for k in RECOMMENDATION_KEYWORDS):
+                continue
+            for href in SECTION_HREF_XPATH(section):
                 full_url = urljoin(base_url, href)
                 if "/product/" in full_url:
                     links.append(full_url)
 
         # Fallback: some layouts might not group recommendations; as a fallback
         # we simply don't add anything rather than risk spurious URLs.
-        seen = set()
-        unique_links: List[str] = []
-        for link in links:
-            if link not in seen:
-                seen.add(link)
-                unique_links.append(link)
+        unique_links: List[str] = list(dict.fromkeys(links))
 
         logger.debug("Extracted %d similar product links.", len(unique_links))
         return unique_links
\ No newline at end of file
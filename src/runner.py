@@ -1,13 +1,23 @@
 import argparse
+import asyncio
+import html as html_lib
 import json
 import logging
+import os
+import re
 import sys
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from extractors.context import Markup, ParsedPage
 from extractors.product_parser import (
     parse_product_info,
     parse_product_variants,
@@ -15,11 +25,41 @@ from extractors.product_parser import (
 )
 from extractors.reviews_parser import parse_reviews
 from extractors.questions_parser import parse_questions
-from outputs.data_exporter import export_dataset
+from extractors.ugc_api import UGCApiConfig, page_results, questions_from_api, review_from_api
+from extractors.utils_format import build_strainer, infer_product_id_from_url
+from outputs.data_exporter import StreamingDatasetWriter
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import requests_cache
+except ImportError:  # optional: only needed for the "cache_path" setting
+    requests_cache = None
+
+try:
+    import httpx
+except ImportError:  # optional: only needed for the "http2" setting
+    httpx = None
 
 BASE_DIR = Path(__file__).resolve().parents[1]
 DEFAULT_INPUTS_PATH = BASE_DIR / "data" / "inputs.sample.json"
 DEFAULT_SETTINGS_PATH = BASE_DIR / "src" / "config" / "settings.example.json"
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s - %(message)s"
+DEFAULT_USER_AGENT = "Mozilla/5.0 (compatible; SephoraScraper/1.0; +https://bitbash.dev)"
+
+# A quoted href attribute pointing at a product page. The lookbehind keeps
+# data-href and similar attributes from matching.
+_HREF_PRODUCT_RE = re.compile(
+    rb"""(?<![\w-])href\s*=\s*["']([^"']*/product/[^"']*)["']""", re.IGNORECASE
+)
+
+# Guards the seen-URL sets that discovery threads share with the scraper.
+_seen_urls_lock = threading.Lock()
 
 def configure_logging(verbosity: int) -> None:
     level = logging.WARNING
@@ -28,16 +68,18 @@ def configure_logging(verbosity: int) -> None:
     elif verbosity >= 2:
         level = logging.DEBUG
 
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
-    )
+    logging.basicConfig(level=level, format=LOG_FORMAT)
+
+def _init_parse_worker(level: int) -> None:
+    # Spawned parse processes start without the parent's logging setup.
+    logging.basicConfig(level=level, format=LOG_FORMAT, force=True)
 
 def load_json_file(path: Path) -> Any:
     if not path.exists():
         raise FileNotFoundError(f"Expected JSON file at {path}")
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    # orjson has no file-object API; both parsers accept UTF-8 bytes.
+    with path.open("rb") as f:
+        return _json_loads(f.read())
 
 def load_settings(path: Path) -> Dict[str, Any]:
     try:
@@ -47,7 +89,7 @@ def load_settings(path: Path) -> Dict[str, Any]:
     except FileNotFoundError:
         logging.warning("Settings file %s not found, using defaults", path)
         return {
-            "user_agent": "Mozilla/5.0 (compatible; SephoraScraper/1.0; +https://bitbash.dev)",
+            "user_agent": DEFAULT_USER_AGENT,
             "timeout": 15,
             "concurrent_requests": 4,
             "export": {
@@ -56,76 +98,246 @@ def load_settings(path: Path) -> Dict[str, Any]:
             },
         }
 
+def _new_session(settings: Dict[str, Any]) -> requests.Session:
+    # With a cache_path, successful responses are kept in an on-disk SQLite
+    # cache, so re-runs and resumed crawls skip pages already downloaded.
+    cache_path = settings.get("cache_path")
+    if not cache_path:
+        return requests.Session()
+    if requests_cache is None:
+        logging.warning("cache_path is set but requests-cache is not installed; caching disabled.")
+        return requests.Session()
+    return requests_cache.CachedSession(
+        cache_name=cache_path,
+        backend="sqlite",
+        expire_after=int(settings.get("cache_ttl", 86400)),
+        allowable_codes=(200,),
+    )
+
 def build_session(settings: Dict[str, Any]) -> requests.Session:
-    session = requests.Session()
-    user_agent = settings.get(
-        "user_agent",
-        "Mozilla/5.0 (compatible; SephoraScraper/1.0; +https://bitbash.dev)",
+    session = _new_session(settings)
+    user_agent = settings.get("user_agent", DEFAULT_USER_AGENT)
+    session.headers.update(
+        {
+            "User-Agent": user_agent,
+            # Only codings urllib3 can decode here (br once brotli is installed).
+            "Accept-Encoding": requests.utils.DEFAULT_ACCEPT_ENCODING,
+            # requests' default too; spelled out because the pooled adapter
+            # below depends on it, including behind older proxies.
+            "Connection": "keep-alive",
+        }
     )
-    session.headers.update({"User-Agent": user_agent})
+
+    # The default pool keeps 10 connections per host. Blocking fetches run on
+    # the default executor, which has one thread per concurrent_requests (see
+    # scrape_async), so a pool that size lets every thread reuse a kept-alive
+    # TLS connection. Transient failures retry on that pool instead of
+    # failing the product.
+    pool_size = max(1, int(settings.get("concurrent_requests", 4)))
+    adapter = HTTPAdapter(
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
     return session
 
-def fetch_html(session: requests.Session, url: str, timeout: int) -> Optional[str]:
+def build_http2_client(settings: Dict[str, Any]) -> Optional["httpx.AsyncClient"]:
+    """
+    Returns an HTTP/2 httpx client when settings enable "http2", so product
+    requests are multiplexed over a few TLS connections instead of one
+    connection per in-flight request. Returns None when HTTP/2 is not
+    enabled or httpx[http2] is not installed; the runner then fetches
+    through the requests session.
+    """
+    if not settings.get("http2"):
+        return None
+    if httpx is None:
+        logging.warning("http2 is set but httpx is not installed; using HTTP/1.1.")
+        return None
+
+    concurrency = max(1, int(settings.get("concurrent_requests", 4)))
+    limits = httpx.Limits(max_connections=concurrency * 2, max_keepalive_connections=concurrency)
+    try:
+        # Transport retries cover connection failures only; status codes are
+        # not retried the way the requests adapter retries them.
+        transport = httpx.AsyncHTTPTransport(http2=True, limits=limits, retries=3)
+    except ImportError:
+        logging.warning("http2 is set but the h2 package is not installed; using HTTP/1.1.")
+        return None
+    return httpx.AsyncClient(
+        headers={"User-Agent": settings.get("user_agent", DEFAULT_USER_AGENT)},
+        transport=transport,
+        follow_redirects=True,
+    )
+
+def fetch_html(session: requests.Session, url: str, timeout: int) -> Optional[bytes]:
+    """
+    Returns the raw response body. lxml detects the page encoding itself, in
+    C, so decoding it to str first would only cost an extra copy.
+    """
     logger = logging.getLogger("fetch_html")
     logger.info("Fetching %s", url)
     try:
         resp = session.get(url, timeout=timeout)
         resp.raise_for_status()
-        return resp.text
+        return resp.content
     except requests.RequestException as exc:
         logger.error("Failed to fetch %s: %s", url, exc)
         return None
 
+async def fetch_html_async(client: "httpx.AsyncClient", url: str, timeout: int) -> Optional[bytes]:
+    """
+    fetch_html() over an httpx client.
+    """
+    logger = logging.getLogger("fetch_html")
+    logger.info("Fetching %s", url)
+    try:
+        resp = await client.get(url, timeout=timeout)
+        resp.raise_for_status()
+        return resp.content
+    except httpx.HTTPError as exc:
+        logger.error("Failed to fetch %s: %s", url, exc)
+        return None
+
+def _fetch_json(
+    session: requests.Session, url: str, params: Dict[str, Any], timeout: int
+) -> Optional[Any]:
+    logger = logging.getLogger("fetch_json")
+    try:
+        resp = session.get(url, params=params, timeout=timeout)
+        resp.raise_for_status()
+        return _json_loads(resp.content)
+    except (requests.RequestException, ValueError) as exc:
+        logger.error("Failed to fetch JSON from %s: %s", url, exc)
+        return None
+
+async def fetch_json_async(
+    session: requests.Session,
+    semaphore: asyncio.Semaphore,
+    url: str,
+    params: Dict[str, Any],
+    timeout: int,
+    client: Optional["httpx.AsyncClient"] = None,
+) -> Optional[Any]:
+    """
+    Fetches and decodes one JSON document under the concurrency semaphore,
+    on client when given and otherwise through session in the executor.
+    Returns None on any HTTP or decoding failure.
+    """
+    async with semaphore:
+        if client is None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, _fetch_json, session, url, params, timeout)
+        try:
+            resp = await client.get(url, params=params, timeout=timeout)
+            resp.raise_for_status()
+            return _json_loads(resp.content)
+        except (httpx.HTTPError, ValueError) as exc:
+            logging.getLogger("fetch_json").error("Failed to fetch JSON from %s: %s", url, exc)
+            return None
+
 def normalize_url(url: str) -> str:
+    # Kept for external callers; the loops in this module inline url.strip().
     return url.strip()
 
 def discover_product_urls_from_category(
     session: requests.Session,
     category_url: str,
     timeout: int,
+    seen: Set[str],
     max_products: int = 100,
 ) -> List[str]:
     """
     Best-effort discovery for product URLs from a Sephora category page.
     If parsing fails, falls back to returning the category URL itself.
+
+    seen is shared across the whole run: URLs already in it are skipped, and
+    every URL returned has been added to it, so max_products counts only
+    products nobody else has claimed yet.
     """
-    logger = logging.getLogger("category_discovery")
-    category_url = normalize_url(category_url)
+    category_url = category_url.strip()
     html = fetch_html(session, category_url, timeout)
-    if not html:
-        return [category_url]
-
-    soup = BeautifulSoup(html, "html.parser")
-    urls: List[str] = []
-
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
-        if "/product/" in href:
-            if href.startswith("/"):
-                href = "https://www.sephora.com" + href
-            urls.append(href)
-
-        if len(urls) >= max_products:
-            break
-
-    deduped: List[str] = []
-    seen = set()
-    for u in urls:
-        u_norm = normalize_url(u)
-        if u_norm not in seen:
-            seen.add(u_norm)
-            deduped.append(u_norm)
-
-    if not deduped:
-        logger.warning(
-            "No product URLs discovered on category page %s, falling back to category URL as product",
-            category_url,
-        )
-        deduped = [category_url]
+    return _claim_category_product_urls(category_url, html, seen, max_products)
+
+def _claim_category_product_urls(
+    category_url: str,
+    html: Optional[bytes],
+    seen: Set[str],
+    max_products: int = 100,
+) -> List[str]:
+    logger = logging.getLogger("category_discovery")
+    # Only the hrefs are needed, so scan the markup for them instead of
+    # building a tree. Values are entity-decoded like a parser would.
+    hrefs = (
+        [html_lib.unescape(href.decode("utf-8", "replace")) for href in _HREF_PRODUCT_RE.findall(html)]
+        if html
+        else []
+    )
+
+    # Listing pages link each product several times; dict.fromkeys drops the
+    # repeats in one C-level pass, keeping first-seen order, before the
+    # shared set is consulted.
+    candidates = dict.fromkeys(
+        ("https://www.sephora.com" + href if href.startswith("/") else href).strip()
+        for href in hrefs
+    )
+
+    # Discovery runs in executor threads, so the membership test and the
+    # insert have to happen together.
+    with _seen_urls_lock:
+        deduped = list(islice((url for url in candidates if url not in seen), max_products))
+        seen.update(deduped)
+
+        if not hrefs:
+            if html:
+                logger.warning(
+                    "No product URLs discovered on category page %s, falling back to category URL as product",
+                    category_url,
+                )
+            if category_url not in seen:
+                seen.add(category_url)
+                deduped.append(category_url)
 
     logger.info("Discovered %d product URLs from category %s", len(deduped), category_url)
     return deduped
 
+def _parse_product_sync(
+    html: Markup,
+    url: str,
+    max_reviews: Optional[int],
+    max_questions: Optional[int],
+    reviews: Optional[List[Dict[str, Any]]] = None,
+    questions: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """
+    Parses one product page. reviews and questions, when given (e.g. from
+    the UGC API), are used instead of scraping those sections from html.
+    """
+    page = ParsedPage.from_html(html, BeautifulSoup(html, "lxml", parse_only=build_strainer()))
+
+    info = parse_product_info(page, url)
+    variants = parse_product_variants(page)
+    if reviews is None:
+        reviews = parse_reviews(page, max_reviews=max_reviews)
+    if questions is None:
+        questions = parse_questions(page, product_id=info.get("id"), max_questions=max_questions)
+    statistics = parse_statistics(page, reviews)
+
+    return {
+        "info": info,
+        "product_variants": variants,
+        "statistics": statistics,
+        "reviews": reviews,
+        "questions": questions,
+    }
+
 def process_product(
     session: requests.Session,
     url: str,
@@ -134,30 +346,284 @@ def process_product(
     max_questions: Optional[int],
 ) -> Optional[Dict[str, Any]]:
     logger = logging.getLogger("process_product")
-    url = normalize_url(url)
+    url = url.strip()
     html = fetch_html(session, url, timeout)
     if not html:
         logger.error("Skipping %s due to fetch failure", url)
         return None
 
-    soup = BeautifulSoup(html, "html.parser")
+    product_payload = _parse_product_sync(html, url, max_reviews, max_questions)
+    logger.debug("Processed product %s", url)
+    return product_payload
 
-    info = parse_product_info(soup, url)
-    variants = parse_product_variants(soup)
-    reviews = parse_reviews(soup, max_reviews=max_reviews)
-    questions = parse_questions(soup, product_id=info.get("id"), max_questions=max_questions)
-    statistics = parse_statistics(soup, reviews)
+async def _fetch_api_pages(
+    session: requests.Session,
+    semaphore: asyncio.Semaphore,
+    url: str,
+    params_for: Callable[[int, int], Dict[str, Any]],
+    page_size: int,
+    max_items: Optional[int],
+    timeout: int,
+    client: Optional["httpx.AsyncClient"],
+) -> Optional[List[Dict[str, Any]]]:
+    # Fetches Offset/Limit pages up to TotalResults (or max_items). The first
+    # page tells how many there are; the rest are independent, so they are
+    # requested together (still bounded by the semaphore) instead of one
+    # round trip after another. Returns the page payloads in offset order,
+    # or None when not even the first page could be fetched, so the caller
+    # can fall back to the HTML.
+    if max_items is not None and max_items <= 0:
+        return []
+    first_limit = page_size if max_items is None else min(page_size, max_items)
+    first = await fetch_json_async(session, semaphore, url, params_for(0, first_limit), timeout, client)
+    page = page_results(first)
+    if page is None:
+        return None
+    results, total = page
+    wanted = total if max_items is None else min(total, max_items)
+    if not results or len(results) >= wanted:
+        return [first]
+
+    # Later pages are laid out by the size the API actually returned.
+    step = len(results)
+    offsets = range(step, wanted, step)
+    rest = await asyncio.gather(
+        *(
+            fetch_json_async(
+                session, semaphore, url, params_for(offset, min(step, wanted - offset)), timeout, client
+            )
+            for offset in offsets
+        )
+    )
+    # A failed later page only loses its own entries.
+    return [first] + [payload for payload in rest if page_results(payload) is not None]
 
-    product_payload: Dict[str, Any] = {
-        "info": info,
-        "product_variants": variants,
-        "statistics": statistics,
-        "reviews": reviews,
-        "questions": questions,
-    }
+async def fetch_reviews_from_api(
+    session: requests.Session,
+    semaphore: asyncio.Semaphore,
+    config: UGCApiConfig,
+    product_id: str,
+    max_reviews: Optional[int],
+    timeout: int,
+    client: Optional["httpx.AsyncClient"] = None,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    A product's reviews from the UGC API, as parse_reviews() records, or
+    None when the API could not be reached.
+    """
+    payloads = await _fetch_api_pages(
+        session,
+        semaphore,
+        config.reviews_url,
+        lambda offset, limit: config.reviews_params(product_id, offset, limit),
+        config.page_size,
+        max_reviews,
+        timeout,
+        client,
+    )
+    if payloads is None:
+        return None
+    reviews = [review_from_api(result) for payload in payloads for result in page_results(payload)[0]]
+    return reviews[:max_reviews] if max_reviews is not None else reviews
+
+async def fetch_questions_from_api(
+    session: requests.Session,
+    semaphore: asyncio.Semaphore,
+    config: UGCApiConfig,
+    product_id: str,
+    max_questions: Optional[int],
+    timeout: int,
+    client: Optional["httpx.AsyncClient"] = None,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    A product's Q&A from the UGC API, as parse_questions() records, or None
+    when the API could not be reached.
+    """
+    payloads = await _fetch_api_pages(
+        session,
+        semaphore,
+        config.questions_url,
+        lambda offset, limit: config.questions_params(product_id, offset, limit),
+        config.page_size,
+        max_questions,
+        timeout,
+        client,
+    )
+    if payloads is None:
+        return None
+    questions = [q for payload in payloads for q in questions_from_api(payload, product_id)]
+    return questions[:max_questions] if max_questions is not None else questions
+
+async def process_product_async(
+    session: requests.Session,
+    semaphore: asyncio.Semaphore,
+    url: str,
+    timeout: int,
+    max_reviews: Optional[int],
+    max_questions: Optional[int],
+    parse_pool: Optional[Executor] = None,
+    client: Optional["httpx.AsyncClient"] = None,
+    ugc_api: Optional[UGCApiConfig] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    process_product for the async pipeline: the fetch runs under the
+    concurrency semaphore, on client when given and otherwise as a blocking
+    requests call in the loop's executor. Parsing is handed to parse_pool
+    (the loop's executor when None), so one product parses while others are
+    still in flight.
+
+    With ugc_api, reviews and questions are read from the JSON API,
+    concurrently with the page fetch, instead of being scraped from the
+    page; the page is still the fallback when the API cannot be reached.
+    """
+    logger = logging.getLogger("process_product")
+    loop = asyncio.get_running_loop()
+    url = url.strip()
+
+    async def fetch_page() -> Optional[bytes]:
+        async with semaphore:
+            if client is not None:
+                return await fetch_html_async(client, url, timeout)
+            return await loop.run_in_executor(None, fetch_html, session, url, timeout)
+
+    product_id = infer_product_id_from_url(url) if ugc_api is not None else None
+    reviews: Optional[List[Dict[str, Any]]] = None
+    questions: Optional[List[Dict[str, Any]]] = None
+    if ugc_api is not None and product_id:
+        html, reviews, questions = await asyncio.gather(
+            fetch_page(),
+            fetch_reviews_from_api(session, semaphore, ugc_api, product_id, max_reviews, timeout, client),
+            fetch_questions_from_api(session, semaphore, ugc_api, product_id, max_questions, timeout, client),
+        )
+    else:
+        html = await fetch_page()
+    if not html:
+        logger.error("Skipping %s due to fetch failure", url)
+        return None
+
+    product_payload = await loop.run_in_executor(
+        parse_pool, _parse_product_sync, html, url, max_reviews, max_questions, reviews, questions
+    )
     logger.debug("Processed product %s", url)
     return product_payload
 
+async def discover_product_urls_async(
+    session: requests.Session,
+    semaphore: asyncio.Semaphore,
+    category_url: str,
+    timeout: int,
+    seen: Set[str],
+    client: Optional["httpx.AsyncClient"] = None,
+) -> List[str]:
+    loop = asyncio.get_running_loop()
+    if client is None:
+        async with semaphore:
+            return await loop.run_in_executor(
+                None, discover_product_urls_from_category, session, category_url, timeout, seen
+            )
+    category_url = category_url.strip()
+    async with semaphore:
+        html = await fetch_html_async(client, category_url, timeout)
+    return _claim_category_product_urls(category_url, html, seen)
+
+async def scrape_async(
+    session: requests.Session,
+    product_urls: List[str],
+    category_urls: List[str],
+    timeout: int,
+    concurrency: int,
+    max_reviews: Optional[int],
+    max_questions: Optional[int],
+    on_record: Callable[[Dict[str, Any]], None],
+    parse_workers: Optional[int] = None,
+    client: Optional["httpx.AsyncClient"] = None,
+    ugc_api: Optional[UGCApiConfig] = None,
+) -> int:
+    """
+    Scrapes the given products plus everything discovered on the category
+    pages, with at most `concurrency` requests in flight. Pages are parsed in
+    a pool of `parse_workers` processes (default: one per CPU), since parsing
+    is CPU-bound and threads would serialize on the GIL.
+
+    Discovery and product scraping form one pipeline: each category page
+    feeds its product URLs into a queue as soon as it returns, and consumer
+    tasks start on them while other categories are still downloading.
+    Each record is passed to on_record as soon as it is parsed, in completion
+    order, and not kept afterwards. Returns the number of records produced.
+
+    When an httpx client is given (see build_http2_client), every fetch goes
+    through it instead of session, and it is closed once the scrape is done.
+    ugc_api switches reviews and questions to the JSON API (see
+    process_product_async).
+    """
+    logger = logging.getLogger("runner")
+    loop = asyncio.get_running_loop()
+    # Fetches are blocking requests calls, so the executor needs one thread per
+    # permitted request; parsing happens in parse_pool instead.
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=concurrency))
+    parse_pool = ProcessPoolExecutor(
+        max_workers=parse_workers or os.cpu_count() or 1,
+        initializer=_init_parse_worker,
+        initargs=(logging.getLogger().level,),
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+
+    queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+    seen_urls: Set[str] = set()
+    scraped = 0
+
+    async def discover(category_url: str) -> None:
+        # Discovery dedupes against seen_urls itself, so its URLs go straight
+        # onto the queue.
+        discovered = await discover_product_urls_async(
+            session, semaphore, category_url, timeout, seen_urls, client
+        )
+        for url in discovered:
+            queue.put_nowait(url)
+
+    async def consume() -> None:
+        nonlocal scraped
+        while True:
+            url = await queue.get()
+            if url is None:
+                return
+            product_data = await process_product_async(
+                session,
+                semaphore,
+                url,
+                timeout,
+                max_reviews,
+                max_questions,
+                parse_pool,
+                client,
+                ugc_api,
+            )
+            if product_data:
+                on_record(product_data)
+                scraped += 1
+
+    # Input URLs are deduped in one dict.fromkeys pass, before any discovery
+    # thread can touch seen_urls.
+    for url in [u for u in dict.fromkeys(url.strip() for url in product_urls) if u]:
+        seen_urls.add(url)
+        queue.put_nowait(url)
+
+    try:
+        with parse_pool:
+            consumers = [asyncio.create_task(consume()) for _ in range(concurrency)]
+            await asyncio.gather(*(discover(c) for c in category_urls))
+            # Discovery is done, so the queue holds everything left; one
+            # sentinel per consumer ends each of them once it has drained.
+            for _ in consumers:
+                queue.put_nowait(None)
+            await asyncio.gather(*consumers)
+    finally:
+        if client is not None:
+            await client.aclose()
+
+    logger.info("Scraped %d of %d unique product URLs", scraped, len(seen_urls))
+    return scraped
+
 def load_inputs(path: Path) -> Dict[str, Any]:
     raw = load_json_file(path)
     if not isinstance(raw, dict):
@@ -220,50 +686,36 @@ def main(argv: Optional[List[str]] = None) -> None:
     session = build_session(settings)
     timeout = int(settings.get("timeout", 15))
 
-    product_urls: List[str] = list(inputs["product_urls"])
-    category_urls: List[str] = list(inputs["category_urls"])
-
-    for category_url in category_urls:
-        discovered = discover_product_urls_from_category(
-            session=session,
-            category_url=category_url,
-            timeout=timeout,
-        )
-        product_urls.extend(discovered)
-
-    # Deduplicate product URLs
-    unique_product_urls: List[str] = []
-    seen_urls = set()
-    for url in product_urls:
-        norm = normalize_url(url)
-        if norm and norm not in seen_urls:
-            seen_urls.add(norm)
-            unique_product_urls.append(norm)
-
-    logger.info("Preparing to scrape %d unique product URLs", len(unique_product_urls))
-
-    dataset: List[Dict[str, Any]] = []
-    for url in unique_product_urls:
-        product_data = process_product(
-            session=session,
-            url=url,
-            timeout=timeout,
-            max_reviews=inputs.get("max_reviews"),
-            max_questions=inputs.get("max_questions"),
-        )
-        if product_data:
-            dataset.append(product_data)
-
-    if not dataset:
-        logger.warning("No data scraped; nothing to export")
-        return
+    concurrency = max(1, int(settings.get("concurrent_requests", 4)))
+    parse_workers = settings.get("parse_workers")
 
     export_cfg = settings.get("export", {})
     formats = export_cfg.get("formats") or ["json"]
     output_path = resolve_output_path(settings)
 
-    export_dataset(dataset, output_path, formats=formats)
-    logger.info("Export complete. Wrote %d records.", len(dataset))
+    # Records are exported as they are scraped rather than collected first,
+    # so memory use does not grow with the size of the run.
+    with StreamingDatasetWriter(output_path, formats=formats) as writer:
+        written = asyncio.run(
+            scrape_async(
+                session=session,
+                product_urls=list(inputs["product_urls"]),
+                category_urls=list(inputs["category_urls"]),
+                timeout=timeout,
+                concurrency=concurrency,
+                max_reviews=inputs.get("max_reviews"),
+                max_questions=inputs.get("max_questions"),
+                on_record=writer.write,
+                parse_workers=int(parse_workers) if parse_workers else None,
+                client=build_http2_client(settings),
+                ugc_api=UGCApiConfig.from_settings(settings),
+            )
+        )
+
+    if not written:
+        logger.warning("No data scraped; nothing to export")
+        return
+    logger.info("Export complete. Wrote %d records.", written)
 
 if __name__ == "__main__":
     main(sys.argv[1:])
\ No newline at end of file
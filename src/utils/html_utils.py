@@ -1,29 +1,68 @@
+import html as html_lib
 import json
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+import lxml.html
 from bs4 import BeautifulSoup, Tag
+from lxml import etree
+
+from ..extractors.utils_format import sselect_one
+
+try:
+    import orjson
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the except
+    # clauses below catch either parser's error.
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+MetaIndex = Dict[Tuple[str, str], Optional[str]]
+# What the review/Q&A extractors accept for their DOM fallback: a soup, the
+# raw HTML, or a zero-argument callable producing either on demand.
+DomSource = Union[BeautifulSoup, str, Callable[[], Union[BeautifulSoup, str]]]
+
+_JSON_LD_SCRIPT_RE = re.compile(
+    # Same attribute anchoring as the script scanners in extractors/context.py.
+    r"<script\b[^>]*(?<![\w-])type\s*=\s*[\"']?application/ld\+json(?=[\s\"'/>])"
+    r"[\"']?[^>]*>(.*?)</script\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+# A whole <meta> tag, allowing ">" inside quoted attribute values.
+_META_TAG_RE = re.compile(r"""<meta\b((?:[^>"']|"[^"]*"|'[^']*')*)>""", re.IGNORECASE)
+_ATTRIBUTE_RE = re.compile(r"""([^\s"'=<>/]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+)))?""")
+_NUMBER_RE = re.compile(r"[\d,.]+")
 
 def extract_json_ld_objects(soup: BeautifulSoup) -> List[Dict[str, Any]]:
     """
     Extracts JSON-LD objects from <script type="application/ld+json"> tags
     and returns a list of parsed dictionaries.
     """
+    scripts = soup.find_all("script", attrs={"type": "application/ld+json"})
+    return _decode_json_ld_blocks(script.string for script in scripts if script.string)
+
+def extract_json_ld_from_html(html: str) -> List[Dict[str, Any]]:
+    """
+    Same result as extract_json_ld_objects, read straight from the raw HTML
+    with a regex so no tree has to be built when JSON-LD is all that's needed.
+    """
+    return _decode_json_ld_blocks(_JSON_LD_SCRIPT_RE.findall(html))
+
+def _decode_json_ld_blocks(blocks: Iterable[str]) -> List[Dict[str, Any]]:
     results: List[Dict[str, Any]] = []
-    for script in soup.find_all("script", attrs={"type": "application/ld+json"}):
-        if not script.string:
-            continue
-        raw = script.string.strip()
+    for block in blocks:
+        raw = block.strip()
         if not raw:
             continue
         try:
-            data = json.loads(raw)
+            data = _json_loads(raw)
         except json.JSONDecodeError:
             # Some sites concatenate multiple JSON objects or use invalid JSON;
             # try a best-effort fix by wrapping in a list or splitting on "}{"
             try:
                 fixed = f"[{raw}]"
-                data = json.loads(fixed)
+                data = _json_loads(fixed)
             except Exception:
                 continue
         if isinstance(data, list):
@@ -53,16 +92,83 @@ def extract_meta_tag(
         return tag["content"].strip()
     return None
 
+def meta_content(
+    meta_index: MetaIndex,
+    name: Optional[str] = None,
+    property: Optional[str] = None,
+) -> Optional[str]:
+    """
+    extract_meta_tag() for a prebuilt index of <meta> tags, looked up by
+    exactly one of name or property.
+    """
+    key = ("name", name) if name else ("property", property)
+    content = meta_index.get(key)
+    if content:
+        return content.strip()
+    return None
+
+def index_meta_tags_from_html(html: str) -> MetaIndex:
+    """
+    Index of the page's <meta> tags for meta_content(), read straight from
+    the raw HTML with a regex. The first tag per (attribute, value) wins,
+    matching what soup.find() returns.
+    """
+    index: MetaIndex = {}
+    for meta_attrs in _META_TAG_RE.findall(html):
+        attrs: Dict[str, str] = {}
+        for key, double, single, bare in _ATTRIBUTE_RE.findall(meta_attrs):
+            # Like the HTML tree builders: names are case-insensitive, values
+            # are entity-decoded, and the first duplicate attribute wins.
+            attrs.setdefault(key.lower(), html_lib.unescape(double or single or bare))
+        for attr in ("name", "property"):
+            if attr in attrs:
+                index.setdefault((attr, attrs[attr]), attrs.get("content"))
+    return index
+
 def extract_numeric_from_text(text: Optional[str]) -> Optional[str]:
     if not text:
         return None
-    match = re.search(r"[\d,.]+", text)
-    if not match:
-        return None
-    return match.group(0)
+    match = _NUMBER_RE.search(text)
+    return match.group(0) if match else None
+
+def resolve_dom_source(source: DomSource) -> Union[BeautifulSoup, str]:
+    # Checked by type first: a Tag is itself callable (soup("a") is find_all).
+    if isinstance(source, (Tag, str)):
+        return source
+    return source()
 
 def find_first(tag: Tag, selector: str) -> Optional[Tag]:
     """
-    Convenience wrapper over BeautifulSoup's select_one().
+    Equivalent of tag.select_one(selector) that compiles each CSS selector
+    once instead of on every call.
+    """
+    return sselect_one(tag, selector)
+
+def parse_lxml_tree(html: str) -> Optional[lxml.html.HtmlElement]:
+    """
+    Parses html into an lxml element tree for XPath queries. Returns None for
+    input lxml cannot build a document from (e.g. empty or whitespace-only).
+    """
+    try:
+        return lxml.html.document_fromstring(html)
+    except (etree.ParserError, ValueError):
+        return None
+
+# Text under these tags is not page text: bs4's get_text() skips it too.
+_LEXBOR_NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+def _lexbor_strings(node: Any) -> Iterator[str]:
+    for child in node.iter(include_text=True):
+        if child.tag == "-text":
+            yield child.text_content
+        elif child.tag not in _LEXBOR_NON_TEXT_TAGS:
+            yield from _lexbor_strings(child)
+
+def lexbor_text(node: Any, separator: str = "") -> str:
+    """
+    selectolax counterpart of Tag.get_text(separator, strip=True): strips
+    every text node outside script, style and template, drops the empty
+    ones and joins the rest.
     """
-    return tag.select_one(selector)
\ No newline at end of file
+    parts = (part.strip() for part in _lexbor_strings(node))
+    return separator.join(part for part in parts if part)
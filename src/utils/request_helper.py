@@ -1,11 +1,15 @@
 import logging
-import time
 from typing import Dict, Optional
 
 import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Statuses worth retrying; anything else non-200 fails immediately.
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
 class RequestHelper:
     """
     Thin wrapper around requests.Session that provides retry logic,
@@ -18,8 +22,29 @@ class RequestHelper:
         timeout: float = 20.0,
         max_retries: int = 3,
         backoff_factor: float = 0.5,
+        pool_size: int = DEFAULT_POOLSIZE,
+        session: Optional[requests.Session] = None,
     ) -> None:
-        self.session = requests.Session()
+        # Callers may supply a Session subclass (e.g. a caching session); it
+        # gets the same adapter and headers as the default one.
+        self.session = session if session is not None else requests.Session()
+
+        # Retries run inside urllib3 on the pooled connection, with exponential
+        # backoff that honours Retry-After. max_retries counts attempts.
+        retry = Retry(
+            total=max(max_retries - 1, 0),
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        # One keep-alive pool per host, sized so concurrent callers sharing
+        # this helper reuse connections instead of opening (and discarding)
+        # a new TLS connection whenever the default 10 slots are taken.
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.timeout = timeout
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
@@ -31,6 +56,13 @@ class RequestHelper:
                 "Chrome/123.0 Safari/537.36"
             ),
             "Accept-Language": "en-US,en;q=0.9",
+            # Pages compress ~10x. This lists only the codings urllib3 can
+            # decode here (br when brotli is installed), so responses are
+            # never sent in an encoding it would pass through undecoded.
+            "Accept-Encoding": requests.utils.DEFAULT_ACCEPT_ENCODING,
+            # requests' default too; spelled out because the sized pool above
+            # depends on it, including behind older proxies.
+            "Connection": "keep-alive",
         }
         if default_headers:
             headers.update(default_headers)
@@ -38,20 +70,22 @@ class RequestHelper:
         self.session.headers.update(headers)
 
     def fetch_html(self, url: str) -> Optional[str]:
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                logger.debug("Requesting %s (attempt %d)", url, attempt)
-                resp = self.session.get(url, timeout=self.timeout)
-                if resp.status_code == 200:
-                    return resp.text
-                logger.warning("Non-200 status for %s: %s", url, resp.status_code)
-            except requests.RequestException as e:
-                logger.warning("Request error for %s: %s", url, e)
-
-            if attempt < self.max_retries:
-                sleep_time = self.backoff_factor * attempt
-                logger.debug("Backing off for %.2f seconds before retry.", sleep_time)
-                time.sleep(sleep_time)
-
-        logger.error("Failed to fetch %s after %d attempts.", url, self.max_retries)
-        return None
\ No newline at end of file
+        logger.debug("Requesting %s", url)
+        try:
+            resp = self.session.get(url, timeout=self.timeout)
+        except requests.RequestException as e:
+            logger.error("Failed to fetch %s after %d attempts: %s", url, self.max_retries, e)
+            return None
+
+        if resp.status_code != 200:
+            logger.error("Non-200 status for %s: %s", url, resp.status_code)
+            return None
+
+        html = resp.text
+        logger.debug(
+            "Fetched %s: %d bytes on the wire, %d decoded",
+            url,
+            resp.raw.tell(),
+            len(resp.content),
+        )
+        return html
\ No newline at end of file